@@ -0,0 +1,154 @@
+# second_brain/cache_core/sqlite_store.py
+"""
+Local, persistent key-value cache backed by SQLite.
+
+Responsibility:
+- Store and retrieve string values by (namespace, key)
+- Record when each entry was written so callers can judge staleness
+
+Local-first: one file under the user cache directory, no server process.
+A broken or unavailable cache behaves like an empty one — cache errors never
+propagate into pipeline stages.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "second_brain" / "cache.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+)
+"""
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached value and the UNIX time it was stored."""
+    value: str
+    created_at: float
+
+
+class SQLiteCache:
+    """
+    Namespaced string cache in a single SQLite file.
+
+    A connection is opened per operation, so one instance is safe to share
+    across the worker threads that run concurrent stages.
+    """
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH) -> None:
+        self.path = path
+        self._initialized = False
+        self._init_lock = threading.Lock()
+
+    def get(self, namespace: str, key: str, max_age_seconds: Optional[float] = None) -> Optional[CacheEntry]:
+        """
+        Return the entry for (namespace, key), or None on miss or cache error.
+
+        Entries older than max_age_seconds (when given) count as a miss.
+        """
+        try:
+            with self._connect() as connection:
+                row = connection.execute(
+                    "SELECT value, created_at FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (namespace, key),
+                ).fetchone()
+        except (sqlite3.Error, OSError):
+            return None
+
+        if row is None:
+            return None
+        entry = CacheEntry(value=row[0], created_at=row[1])
+        if max_age_seconds is not None and time.time() - entry.created_at > max_age_seconds:
+            return None
+        return entry
+
+    def set(self, namespace: str, key: str, value: str) -> None:
+        """Store value under (namespace, key), replacing any previous entry. Never raises."""
+        try:
+            with self._connect() as connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO cache_entries (namespace, key, value, created_at) VALUES (?, ?, ?, ?)",
+                    (namespace, key, value, time.time()),
+                )
+        except (sqlite3.Error, OSError):
+            # Caching is an optimization; losing a write only costs a future miss
+            pass
+
+    def entries(self, namespace: str) -> List[Tuple[str, CacheEntry]]:
+        """Return every (key, entry) in namespace; empty on cache error."""
+        try:
+            with self._connect() as connection:
+                rows = connection.execute(
+                    "SELECT key, value, created_at FROM cache_entries WHERE namespace = ?",
+                    (namespace,),
+                ).fetchall()
+        except (sqlite3.Error, OSError):
+            return []
+        return [(key, CacheEntry(value=value, created_at=created_at)) for key, value, created_at in rows]
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, commit (or roll back) on exit, and always close it."""
+        if not self._initialized:
+            self._initialize()
+        connection = sqlite3.connect(self.path, timeout=5.0)
+        try:
+            with connection:
+                yield connection
+        finally:
+            connection.close()
+
+    def _initialize(self) -> None:
+        with self._init_lock:
+            if self._initialized:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=5.0)
+            try:
+                with connection:
+                    connection.execute(_SCHEMA)
+            finally:
+                connection.close()
+            self._initialized = True
+
+
+_DEFAULT_CACHE: Optional[SQLiteCache] = None
+
+
+def get_cache() -> SQLiteCache:
+    """Return the process-wide cache at DEFAULT_CACHE_PATH (created on first use)."""
+    global _DEFAULT_CACHE  # pylint: disable=global-statement
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = SQLiteCache()
+    return _DEFAULT_CACHE
+
+
+# High-Level Intent
+# cache_core/sqlite_store.py gives pipelines a place to remember expensive,
+# deterministic results (LLM responses, remote metadata) across runs.
+# It is deliberately dumb: string values only, callers own serialization,
+# key design and invalidation (e.g. by embedding a prompt version in the key).
+
+# Edge Cases & Failure Scenarios
+# Cache directory not writable → every get() misses, set() is a no-op
+# Concurrent writers (threads/processes) → SQLite locking, 5s busy timeout
+# Corrupt file → sqlite3.DatabaseError → treated as a miss
+
+# Extension Points
+# Periodic pruning of old entries
+# Configurable location via CLI/config
@@ -20,8 +20,23 @@ from pathlib import Path
 
 import typer
 
-from second_brain.content_ingestor.runner import run_ingestion
-from second_brain.content_ingestor.output.writer import write_artifact
+# Pipeline modules are imported inside commands, not here: --help and shell
+# completion should not pay for pydantic models or the stage import graph.
+
+
+def _style_banner(text: str, **style: object) -> str:
+    """Style a status banner once at import; honours the NO_COLOR convention."""
+    if os.environ.get("NO_COLOR"):
+        return text
+    return typer.style(text, **style)
+
+
+# Status banners are constant, so ANSI styling is computed once per process
+_SUCCESS_BANNER = _style_banner("✓ Ingestion completed successfully!", fg=typer.colors.GREEN, bold=True)
+_PARTIAL_BANNER = _style_banner(
+    "⚠ Partial success — check diagnostics in the JSON artifact or logs above.", fg=typer.colors.YELLOW
+)
+_FAILURE_BANNER = _style_banner("✗ Ingestion failed", fg=typer.colors.RED, bold=True)
 
 
 app = typer.Typer(
@@ -67,24 +82,27 @@ def ingest(
     }
 
     try:
+        from second_brain.content_ingestor.runner import run_ingestion
+        from second_brain.content_ingestor.output.writer import write_artifact
+
         content_object = run_ingestion(url, config=config)
         artifact_path = write_artifact(content_object, output_path)
 
         typer.echo("")
-        typer.echo(typer.style("✓ Ingestion completed successfully!", fg=typer.colors.GREEN, bold=True))
+        typer.echo(_SUCCESS_BANNER)
         typer.echo(f"Artifact written to: {artifact_path}")
 
-        diagnostics = content_object.get("diagnostics", {})
-        if diagnostics.get("warnings") or diagnostics.get("errors"):
+        diagnostics = content_object.diagnostics
+        if diagnostics.warnings or diagnostics.errors:
             typer.echo("")
-            typer.echo(typer.style("⚠ Partial success — check diagnostics in the JSON artifact or logs above.", fg=typer.colors.YELLOW))
+            typer.echo(_PARTIAL_BANNER)
 
     except KeyboardInterrupt:
         typer.echo("\nInterrupted by user.", err=True)
         sys.exit(1)
     except Exception as exc:  # pylint: disable=broad-except
         typer.echo("")
-        typer.echo(typer.style("✗ Ingestion failed", fg=typer.colors.RED, bold=True), err=True)
+        typer.echo(_FAILURE_BANNER, err=True)
         typer.echo(f"Error: {exc}", err=True)
         typer.echo("")
         typer.echo("See structured JSON logs above for detailed diagnostics and suggested fixes.", err=True)
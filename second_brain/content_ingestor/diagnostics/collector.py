@@ -8,7 +8,7 @@ diagnostics section of the output artifact.
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Dict
 from uuid import UUID
 
 from second_brain.content_ingestor.schema import Diagnostics, StageResult
@@ -19,44 +19,59 @@ class DiagnosticsCollector:
     Accumulates StageResult objects and synthesizes global diagnostics.
 
     Thread-safe not required (single-threaded pipeline).
+    Single-use: build_diagnostics_model() hands internal state to the output,
+    so no further results may be added afterwards.
     """
 
     def __init__(self, run_id: UUID) -> None:
         self.run_id = run_id
         self._stage_status: Dict[str, StageResult] = {}
-        self._global_warnings: List[str] = []
-        self._global_errors: List[str] = []
-        self._global_suggested_fixes: List[str] = []
+        # Insertion-ordered sets: identical messages repeated across stages
+        # (e.g. "Review logs") are stored once, in first-seen order.
+        self._global_warnings: Dict[str, None] = {}
+        self._global_errors: Dict[str, None] = {}
+        self._global_suggested_fixes: Dict[str, None] = {}
+        self._built = False
 
     def add_stage_result(self, result: StageResult) -> None:
         """Add a stage result and merge global fields."""
+        if self._built:
+            raise RuntimeError("Cannot add stage results after diagnostics were built")
         if result.stage_name in self._stage_status:
             raise ValueError(f"Duplicate stage result for {result.stage_name}")
 
         self._stage_status[result.stage_name] = result
 
-        self._global_warnings.extend(result.warnings)
-        self._global_errors.extend(result.errors)
-        self._global_suggested_fixes.extend(result.suggested_fixes)
+        self._global_warnings.update(dict.fromkeys(result.warnings))
+        self._global_errors.update(dict.fromkeys(result.errors))
+        self._global_suggested_fixes.update(dict.fromkeys(result.suggested_fixes))
 
         # Also merge structured failures' suggested fixes
         for failure in result.failures:
-            self._global_suggested_fixes.extend(failure.suggested_fixes)
+            self._global_suggested_fixes.update(dict.fromkeys(failure.suggested_fixes))
 
     def has_fatal_failure(self) -> bool:
         """Return True if any stage reported success=False."""
         return any(not result.success for result in self._stage_status.values())
 
-    def build_diagnostics(self) -> Dict[str, any]:
-        """Build the final diagnostics dict conforming to schema."""
-        diag = Diagnostics(
-            stage_status=self._stage_status.copy(),
-            warnings=self._global_warnings.copy(),
-            errors=self._global_errors.copy(),
-            suggested_fixes=list(set(self._global_suggested_fixes)),  # dedupe
+    def build_diagnostics_model(self) -> Diagnostics:
+        """
+        Build the final Diagnostics model.
+
+        The runner embeds this instance directly in the content object, so the
+        already-validated StageResult models are not dumped and re-parsed
+        during final ContentObject validation.
+        """
+        # The collector is discarded after this call, so state is handed over
+        # without defensive copies; the guard in add_stage_result keeps that safe.
+        self._built = True
+        return Diagnostics(
+            stage_status=self._stage_status,
+            warnings=list(self._global_warnings),
+            errors=list(self._global_errors),
+            suggested_fixes=list(self._global_suggested_fixes),
         )
-        return diag.model_dump(by_alias=False, exclude_none=True)
-    
+
 
 # High-Level Intent
 # Central aggregator for all StageResult objects.
@@ -64,15 +79,15 @@ class DiagnosticsCollector:
 
 # Collect results by stage_name.
 # Merge global warnings/errors/suggested_fixes.
-# Produce the final diagnostics dict for ContentObject.
+# Produce the final Diagnostics model for ContentObject.
 # Provide query helpers (e.g., has_fatal_failure()).
 
 # This isolates diagnostics logic from the runner, making runner orchestration cleaner.
 # Architecture
 
 # DiagnosticsCollector class: mutable accumulator.
-# Methods: add_stage_result, build_diagnostics.
-# Immutable output via .build_diagnostics() returning dict ready for schema.
+# Methods: add_stage_result, has_fatal_failure, build_diagnostics_model.
+# Output via .build_diagnostics_model(): a validated Diagnostics model the runner embeds as-is.
 
 # Data Flow
 # Runner creates collector → passes to each stage (or adds post-stage) → final build → inserted into content_object.
\ No newline at end of file
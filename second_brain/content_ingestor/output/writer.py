@@ -0,0 +1,104 @@
+# second_brain/content_ingestor/output/writer.py
+"""
+Artifact writer for the Content Ingestor pipeline.
+
+Responsibility:
+- Serialize the final content object to JSON
+- Write it to the output directory under a traceable filename
+
+The runner hands over the ContentObject model itself; pydantic-core encodes it
+to JSON in a single native pass (no intermediate python dict). The transcript —
+the only field that grows with video length — is streamed to disk in chunks
+rather than embedded in one document-sized string.
+Raises OSError on filesystem failures — the CLI adapter reports them.
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from pathlib import Path
+from typing import TextIO
+
+from second_brain.content_ingestor.schema import ContentObject
+
+
+# Characters of transcript encoded and written per chunk
+TRANSCRIPT_CHUNK_CHARS = 65536
+
+
+def build_artifact_filename(content_object: ContentObject) -> str:
+    """
+    Build the artifact filename from traceability fields.
+
+    Uses video_id when validation succeeded and always appends content_id,
+    so re-ingesting the same video never overwrites an earlier artifact.
+    """
+    video_id = content_object.source.video_id or "unknown"
+    return f"{video_id}_{content_object.identity.content_id}.json"
+
+
+def write_artifact(content_object: ContentObject, output_dir: Path) -> Path:
+    """
+    Write the content object as a JSON artifact.
+
+    Args:
+        content_object: Final ContentObject from run_ingestion
+        output_dir: Directory to write into (created if missing)
+
+    Returns:
+        Path of the written artifact.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+    artifact_path = output_dir / build_artifact_filename(content_object)
+
+    with artifact_path.open("w", encoding="utf-8") as artifact_file:
+        _write_content_object(content_object, artifact_file)
+
+    return artifact_path
+
+
+def _write_content_object(content_object: ContentObject, artifact_file: TextIO) -> None:
+    """
+    Serialize content_object into artifact_file, streaming the transcript.
+
+    The document is dumped with a unique placeholder in place of the
+    transcript, split at that placeholder, and the transcript is written
+    between the halves in JSON-escaped chunks. Peak memory is therefore the
+    small document plus one chunk, not a second copy of the transcript.
+    """
+    transcript = content_object.raw.transcript_text
+    if isinstance(transcript, str) and transcript:
+        placeholder = f"transcript-placeholder-{uuid.uuid4().hex}"
+        document = content_object.model_copy(
+            update={"raw": content_object.raw.model_copy(update={"transcript_text": placeholder})}
+        )
+    else:
+        transcript = None
+        document = content_object
+
+    # warnings=False: an object that failed final validation is kept unvalidated
+    # for auditability, and serializing its raw sections must not be noisy.
+    payload = document.model_dump_json(indent=2, exclude_none=True, warnings=False)
+
+    if transcript is None:
+        artifact_file.write(payload)
+        return
+
+    head, tail = payload.split(placeholder, 1)
+    artifact_file.write(head)
+    for start in range(0, len(transcript), TRANSCRIPT_CHUNK_CHARS):
+        chunk = transcript[start:start + TRANSCRIPT_CHUNK_CHARS]
+        # Escape the chunk body only; the surrounding quotes come from head/tail
+        artifact_file.write(json.dumps(chunk, ensure_ascii=False)[1:-1])
+    artifact_file.write(tail)
+
+
+# High-Level Intent
+# output/writer.py is the final adapter between the pipeline and the filesystem.
+# It performs no validation or transformation — the runner already produced a
+# schema-conforming ContentObject. It only encodes and persists it.
+
+# Edge Cases & Failure Scenarios
+# Early validation failure (no video_id) → artifact still written as unknown_<content_id>.json
+# Unwritable directory / disk full → OSError propagates to the CLI, which reports it
@@ -4,7 +4,7 @@ Orchestration runner for the YouTube Content Ingestor pipeline.
 
 Responsibilities:
 - Initialize traceability and supporting objects
-- Execute stages in fixed order
+- Execute stages in fixed order (independent stages concurrently)
 - Aggregate diagnostics
 - Validate and return final content object
 
@@ -13,34 +13,181 @@ No business logic lives here — only orchestration.
 
 from __future__ import annotations
 
+import asyncio
+import importlib
+import types
 import uuid
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, Mapping, Tuple
 import logging
 
-from second_brain.content_ingestor.schema import ContentObject, Identity, Source
-from second_brain.content_ingestor.diagnostics.collector import DiagnosticsCollector
-from second_brain.content_ingestor.stages import (
-    validate_input,
-    fetch_metadata,
-    fetch_transcript,
-    analyze_structure,
-    analyze_semantics,
+from pydantic import ValidationError
+
+from second_brain.content_ingestor.schema import (
+    ContentObject,
+    FailureType,
+    Identity,
+    Raw,
+    Semantics,
+    Source,
+    StageFailure,
+    StageResult,
+    Structure,
 )
-from second_brain.logging_core.logger import get_logger, log_event
-from second_brain.logging_core import logger as log_mod  # for type hints
-
-
+from second_brain.content_ingestor.diagnostics.collector import DiagnosticsCollector
+from second_brain.content_ingestor.stages.base import Stage
+from second_brain.logging_core.logger import RunLogger, flush_logs, get_logger, log_event
+
+
+# Stages are declared by dotted module path and imported only when they run.
+# Heavy dependencies (yt-dlp, Whisper/CTranslate2, LLM clients) are therefore never
+# loaded for `--help` or for runs that stop before reaching those stages.
+#
+# Each entry is (stage_name, module_path, fatal_on_failure). Names are known
+# without importing; a failed fatal stage (e.g. an invalid URL) stops the run
+# so later stages do not make doomed network calls.
+# Stages are grouped into waves. Waves run in order; stages within a wave have
+# no data dependency on each other and run concurrently (each in a worker
+# thread), so network-bound stages overlap instead of adding up.
 STAGES = [
-    validate_input.process,
-    fetch_metadata.process,
-    fetch_transcript.process,
-    analyze_structure.process,
-    analyze_semantics.process,
+    [("validate_input", "second_brain.content_ingestor.stages.validate_input", True)],
+    [
+        ("fetch_metadata", "second_brain.content_ingestor.stages.fetch_metadata", False),
+        ("fetch_transcript", "second_brain.content_ingestor.stages.fetch_transcript", False),
+    ],
+    # Structure and semantics read the same raw inputs and write disjoint
+    # sections, so their LLM calls overlap: wall time is the slower of the two.
+    [
+        ("analyze_structure", "second_brain.content_ingestor.stages.analyze_structure", False),
+        ("analyze_semantics", "second_brain.content_ingestor.stages.analyze_semantics", False),
+    ],
 ]
 
+# Suggested fixes attached to any stage that raises unexpectedly
+UNEXPECTED_EXCEPTION_FIXES = ("Review logs", "Report bug with traceback")
+
+# Shared read-only config for runs without one (avoids a new dict per stage)
+_EMPTY_CONFIG: Mapping[str, Any] = types.MappingProxyType({})
+
+# Content object sections populated by stages, with their schema models
+SECTION_MODELS = {
+    "identity": Identity,
+    "source": Source,
+    "raw": Raw,
+    "structure": Structure,
+    "semantics": Semantics,
+}
+
+# Resolved stage functions, keyed by module path (filled on first use)
+_RESOLVED_STAGES: Dict[str, Stage] = {}
+
+
+def _resolve_stage(module_path: str) -> Stage:
+    """
+    Import a stage module on first use and return its process() function.
+
+    Import errors propagate to the caller, which converts them into a
+    structured stage failure like any other unexpected exception.
+    """
+    stage_func = _RESOLVED_STAGES.get(module_path)
+    if stage_func is None:
+        stage_func = importlib.import_module(module_path).process
+        _RESOLVED_STAGES[module_path] = stage_func
+    return stage_func
+
+
+async def _run_stage(
+    stage_name: str,
+    module_path: str,
+    content_object: Dict[str, Any],
+    run_id: uuid.UUID,
+    config: Mapping[str, Any],
+    logger: RunLogger,
+) -> Tuple[Dict[str, Any], StageResult]:
+    """
+    Execute one stage in a worker thread and contain any exception.
+
+    Stages mutate the shared content_object in place (concurrent stages write
+    disjoint keys). Never raises: unhandled exceptions become a StageResult
+    with a structured failure.
+    """
+    log_event(
+        logger,
+        logging.INFO,
+        f"Starting stage",
+        stage_name=stage_name,
+        event_type="start",
+    )
+
+    try:
+        stage_func = _resolve_stage(module_path)
+        content_object, stage_result = await asyncio.to_thread(stage_func, content_object, run_id, config)
+
+        log_event(
+            logger,
+            logging.INFO if stage_result.success else logging.WARNING,
+            f"Stage completed",
+            stage_name=stage_name,
+            event_type="success" if stage_result.success else "failure",
+            metadata={"success": stage_result.success},
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        # Convert unhandled exception to stage failure
+        failure = StageFailure(
+            stage=stage_name,
+            type=FailureType.SOURCE_ERROR,  # conservative default
+            cause="unexpected_exception",
+            impact="stage aborted",
+            suggested_fixes=UNEXPECTED_EXCEPTION_FIXES,
+        )
+        stage_result = StageResult(
+            stage_name=stage_name,
+            success=False,
+            errors=[f"Unhandled exception: {str(exc)}"],
+            failures=[failure],
+        )
+
+        log_event(
+            logger,
+            logging.ERROR,
+            f"Unhandled exception in stage",
+            stage_name=stage_name,
+            event_type="failure",
+            metadata={"exception": str(exc)},
+        )
+
+    return content_object, stage_result
+
+
+def _construct_unvalidated(content_object: Dict[str, Any]) -> ContentObject:
+    """
+    Wrap a content object that failed final validation, discarding nothing.
+
+    Each section is validated on its own; sections that still fail are kept
+    unvalidated via model_construct so their data stays in the artifact.
+    """
+    sections: Dict[str, Any] = {}
+    for section_name, model in SECTION_MODELS.items():
+        section = content_object.get(section_name) or {}
+        try:
+            sections[section_name] = model.model_validate(section)
+        except ValidationError:
+            sections[section_name] = model.model_construct(**section)
+    return ContentObject.model_construct(**sections, diagnostics=content_object["diagnostics"])
 
-def run_ingestion(url: str, config: Dict[str, Any] | None = None) -> Dict[str, Any]:
+
+def run_ingestion(url: str, config: Dict[str, Any] | None = None) -> ContentObject:
+    """
+    Execute the full ingestion pipeline for a YouTube URL (synchronous entry point).
+
+    Thin wrapper over run_ingestion_async for callers without an event loop
+    (CLI, scripts, cron). Must not be called from inside a running loop —
+    await run_ingestion_async instead.
+    """
+    return asyncio.run(run_ingestion_async(url, config=config))
+
+
+async def run_ingestion_async(url: str, config: Dict[str, Any] | None = None) -> ContentObject:
     """
     Execute the full ingestion pipeline for a YouTube URL.
 
@@ -49,22 +196,26 @@ def run_ingestion(url: str, config: Dict[str, Any] | None = None) -> Dict[str, A
         config: Optional configuration dict for stages (e.g., transcription settings)
 
     Returns:
-        Complete content object dict conforming to ContentObject schema.
-        Artifact is always produced, even on partial failure.
+        The ContentObject model, ready for the writer to serialize in one pass.
+        Artifact is always produced, even on partial failure: if final
+        validation fails, the object is returned unvalidated (see logs).
     """
     run_id = uuid.uuid4()
-    logger = get_logger(run_id)
+    # String form computed once; used for logs, metadata and Identity
+    run_id_str = run_id.hex
+    logger = get_logger(run_id_str)
 
     log_event(
         logger,
         logging.INFO,
         "Starting YouTube content ingestion pipeline",
         event_type="pipeline_start",
-        metadata={"url": url, "run_id": str(run_id)},
+        metadata={"url": url, "run_id": run_id_str},
     )
+    flush_logs(logger)
 
-    # Initialize traceability
-    identity = Identity()
+    # Initialize traceability; the artifact carries the same run id as the logs
+    identity = Identity(workflow_run_id=run_id_str)
     content_object: Dict[str, Any] = {
         "identity": identity.model_dump(),
         "source": Source(url=url).model_dump(),
@@ -76,64 +227,47 @@ def run_ingestion(url: str, config: Dict[str, Any] | None = None) -> Dict[str, A
 
     collector = DiagnosticsCollector(run_id)
 
-    # Execute stages
-    for stage_func in STAGES:
-        stage_name = stage_func.__module__.split('.')[-1]
-        log_event(
-            logger,
-            logging.INFO,
-            f"Starting stage",
-            stage_name=stage_name,
-            event_type="start",
-        )
+    # One read-only view shared by all stages, so no stage can alter another's config
+    effective_config: Mapping[str, Any] = types.MappingProxyType(config) if config else _EMPTY_CONFIG
 
-        try:
-            content_object, stage_result = stage_func(content_object, run_id, config or {})
-            collector.add_stage_result(stage_result)
-
-            log_event(
-                logger,
-                logging.INFO if stage_result.success else logging.WARNING,
-                f"Stage completed",
-                stage_name=stage_name,
-                event_type="success" if stage_result.success else "failure",
-                metadata={"success": stage_result.success},
-            )
-        except Exception as exc:  # pylint: disable=broad-except
-            # Convert unhandled exception to stage failure
-            from second_brain.content_ingestor.schema import StageResult, StageFailure, FailureType
-
-            failure = StageFailure(
-                stage=stage_name,
-                type=FailureType.SOURCE_ERROR,  # conservative default
-                cause="unexpected_exception",
-                impact="stage aborted",
-                suggested_fixes=["Review logs", "Report bug with traceback"],
-            )
-            stage_result = StageResult(
-                stage_name=stage_name,
-                success=False,
-                errors=[f"Unhandled exception: {str(exc)}"],
-                failures=[failure],
+    # Execute stages wave by wave; results are recorded in declared order
+    for wave_index, wave in enumerate(STAGES):
+        outcomes = await asyncio.gather(
+            *(
+                _run_stage(stage_name, module_path, content_object, run_id, effective_config, logger)
+                for stage_name, module_path, _ in wave
             )
+        )
+        fatal_stages = []
+        for (stage_name, _, fatal_on_failure), (content_object, stage_result) in zip(wave, outcomes):
             collector.add_stage_result(stage_result)
+            if fatal_on_failure and not stage_result.success:
+                fatal_stages.append(stage_name)
 
+        if fatal_stages:
+            skipped_stages = [stage[0] for later_wave in STAGES[wave_index + 1:] for stage in later_wave]
             log_event(
                 logger,
-                logging.ERROR,
-                f"Unhandled exception in stage",
-                stage_name=stage_name,
-                event_type="failure",
-                metadata={"exception": str(exc)},
+                logging.WARNING,
+                "Fatal stage failure — skipping remaining stages",
+                event_type="pipeline_abort_early",
+                metadata={"failed_stages": fatal_stages, "skipped_stages": skipped_stages},
             )
+            flush_logs(logger)
+            break
+
+        flush_logs(logger)
 
-    # Assemble diagnostics
-    content_object["diagnostics"] = collector.build_diagnostics()
+    # Assemble diagnostics as a model: pydantic accepts the instance as-is
+    # during final validation instead of re-parsing every StageResult.
+    diagnostics = collector.build_diagnostics_model()
+    content_object["diagnostics"] = diagnostics
 
-    # Final validation (best effort)
+    # Final validation (best effort). Stages still exchange plain dicts, so
+    # this remains the single point where the schema contract is enforced.
+    # No dump here: the writer serializes the model directly (single pass).
     try:
         validated = ContentObject.model_validate(content_object)
-        content_object = validated.model_dump(by_alias=False, exclude_none=True)
         log_event(logger, logging.INFO, "Pipeline completed successfully", event_type="pipeline_success")
     except Exception as exc:  # pylint: disable=broad-except
         log_event(
@@ -144,8 +278,10 @@ def run_ingestion(url: str, config: Dict[str, Any] | None = None) -> Dict[str, A
             metadata={"validation_error": str(exc)},
         )
         # Return raw object anyway for auditability
+        validated = _construct_unvalidated(content_object)
 
-    return content_object
+    flush_logs(logger)
+    return validated
 
 
 
@@ -156,17 +292,19 @@ def run_ingestion(url: str, config: Dict[str, Any] | None = None) -> Dict[str, A
 # Generate traceability IDs
 # Initialize the empty content_object with identity
 # Create DiagnosticsCollector and logger
-# Execute stages in strict, declared order
+# Execute stages in strict, declared order (independent stages share a wave and run concurrently)
 # Aggregate results and insert diagnostics
 # Validate final object against schema
-# Return the complete, validated content dict (ready for writer)
+# Return the complete, validated ContentObject (ready for writer)
 
 # It contains no business logic — only orchestration and error containment.
-# Stages are imported explicitly (no dynamic loading) for clarity and testability.
+# Stages are declared explicitly by module path and imported lazily on first use,
+# so heavy dependencies are only loaded by stages that actually execute.
 # Architecture
 
-# run_ingestion(url: str) -> dict: Public entry point (called by CLI).
-# Fixed list of stages: [validate_input, fetch_metadata, ...]
+# run_ingestion(url: str) -> ContentObject: Public sync entry point (called by CLI).
+# run_ingestion_async(url: str) -> ContentObject: The same pipeline for callers with an event loop.
+# Fixed list of stage waves: [[validate_input], [fetch_metadata, fetch_transcript], [analyze_structure, analyze_semantics]]
 # Each stage called with mutable content_object and run_id
 # DiagnosticsCollector centralized
 # Structured logging at key milestones
@@ -179,16 +317,15 @@ def run_ingestion(url: str, config: Dict[str, Any] | None = None) -> Dict[str, A
 # → content_object = {"identity": {...}, "source": {"url": url, ...}}
 # → for each stage:
 #   log start → call stage → log result → collector.add → mutate content_object
-# → insert diagnostics → validate → return dict
+# → insert diagnostics → validate → return ContentObject
 # Edge Cases & Failure Scenarios
 
-# Early stage failure (e.g., invalid URL) → subsequent stages skipped, diagnostics explain, artifact still produced.
+# Early stage failure (e.g., invalid URL) → fatal stage, subsequent stages skipped (pipeline_abort_early logged), diagnostics explain, artifact still produced.
 # Exception in stage → caught, converted to StageResult with failure, pipeline continues.
-# Schema validation failure at end → wrapped as diagnostic, raw dict still returned (graceful degradation).
+# Schema validation failure at end → logged, unvalidated ContentObject still returned (graceful degradation).
 # No transcript/metadata → partial object valid.
 
 # Extension Points
 
 # Stage list injectable via config later.
-# Parallel stages (if independent) via executor.
 # Pre/post hooks for future governance.
\ No newline at end of file
@@ -14,7 +14,7 @@ Schema changes require explicit justification and migration planning.
 from __future__ import annotations
 
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
@@ -33,6 +33,21 @@ class FailureType(str, Enum):
 
 #sff
 
+# Shared config for small, construct-once contract models: immutable after
+# construction, no ad-hoc fields, and already-built instances are accepted
+# as-is when nested (no revalidation on reuse).
+# These stay pydantic models rather than slotted dataclasses on purpose: a run
+# creates only a handful of them, and construction-time validation (e.g. the
+# FailureType enum) is part of the contract a plain dataclass would drop.
+IMMUTABLE_CONTRACT_CONFIG = ConfigDict(
+    frozen=True,
+    extra="forbid",
+    validate_assignment=False,
+    revalidate_instances="never",
+    defer_build=False,
+)
+
+
 class StageFailure(BaseModel):
     """Structured representation of a single failure."""
     stage: str
@@ -41,6 +56,8 @@ class StageFailure(BaseModel):
     impact: str
     suggested_fixes: List[str] = Field(default_factory=list)
 
+    model_config = IMMUTABLE_CONTRACT_CONFIG
+
 
 class StageResult(BaseModel):
     """
@@ -57,16 +74,21 @@ class StageResult(BaseModel):
     suggested_fixes: List[str] = Field(default_factory=list)
     execution_time_ms: Optional[float] = None
 
-    model_config = ConfigDict(frozen=True)
+    model_config = IMMUTABLE_CONTRACT_CONFIG
 
 
 class Identity(BaseModel):
     """Traceability and reproducibility fields."""
-    content_id: uuid.UUID = Field(default_factory=uuid.uuid4)
-    workflow_run_id: uuid.UUID = Field(default_factory=uuid.uuid4)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    # IDs are only ever consumed as strings (artifact, filenames, logs), so
+    # they are stored as 32-char hex rather than UUID objects.
+    content_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    workflow_run_id: str = Field(default_factory=lambda: uuid.uuid4().hex)
+    # Timezone-aware UTC; datetime.utcnow() is deprecated and returns naive values
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     workflow_version: str = "0.1.0"
 
+    model_config = IMMUTABLE_CONTRACT_CONFIG
+
 
 class Source(BaseModel):
     """Immutable origin facts."""
@@ -80,6 +102,8 @@ class Source(BaseModel):
     language: Optional[str] = None
     captions_available: Optional[bool] = None
 
+    model_config = IMMUTABLE_CONTRACT_CONFIG
+
 
 class Raw(BaseModel):
     """Lossless ground truth data."""
@@ -138,7 +162,15 @@ class ContentObject(BaseModel):
             # This should only happen on early validation failure — still valid for diagnostics
             pass
         return self
-    
+
+
+# Complete every model's validator/serializer at import time. Any model whose
+# schema is still pending (e.g. unresolved forward references) is built here,
+# so the first pipeline run never pays schema-build latency mid-ingestion.
+for _model in (StageFailure, StageResult, Identity, Source, Raw, Structure, Semantics, Diagnostics, ContentObject):
+    _model.model_rebuild(force=False)
+del _model
+
 
 
 # High-Level Intent
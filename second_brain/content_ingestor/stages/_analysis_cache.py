@@ -0,0 +1,91 @@
+# second_brain/content_ingestor/stages/_analysis_cache.py
+"""
+Persistent memo of validated analysis sections, keyed by content fingerprint.
+
+Re-ingesting a video (channel rescans, retries) with an unchanged transcript
+reuses the previously validated structure/semantics section without building
+a prompt or touching the LLM.
+
+The fingerprint covers the video id and every analysis input (title,
+description, transcript, chapters); content_id is not used because it is generated
+fresh on each run. Keys also embed what produced the section — the prompt
+version, the model, and whether it came from the combined call — so editing a
+prompt or switching models re-analyzes everything once, and per-stage and
+combined results never stand in for each other.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from second_brain.cache_core.sqlite_store import get_cache
+
+
+CACHE_NAMESPACE = "analysis_section"
+
+
+@dataclass(frozen=True)
+class CachedSection:
+    """A stored section and the UNIX time it was analyzed."""
+    section: Dict[str, Any]
+    created_at: float
+
+
+def fingerprint(content_object: Dict[str, Any]) -> str:
+    """128-bit BLAKE2b over the video id and the analysis inputs."""
+    digest = hashlib.blake2b(digest_size=16)
+    source = content_object["source"]
+    raw = content_object["raw"]
+    chapters = raw.get("chapters")
+    for part in (
+        source.get("video_id"),
+        source.get("title"),
+        raw.get("description_text"),
+        raw.get("transcript_text"),
+        json.dumps(chapters, ensure_ascii=False) if chapters else None,
+    ):
+        digest.update((part or "").encode("utf-8"))
+        digest.update(b"\0")  # separator so field boundaries cannot collide
+    return digest.hexdigest()
+
+
+def _key(stage_name: str, prompt_version: str, model: str, combined: bool, content_fingerprint: str) -> str:
+    mode = "combined" if combined else "single"
+    return f"{stage_name}:{prompt_version}:{model}:{mode}:{content_fingerprint}"
+
+
+def get_section(
+    stage_name: str,
+    prompt_version: str,
+    model: str,
+    combined: bool,
+    content_fingerprint: str,
+) -> Optional[CachedSection]:
+    """Return the section stored for this content and analysis setup, or None."""
+    entry = get_cache().get(CACHE_NAMESPACE, _key(stage_name, prompt_version, model, combined, content_fingerprint))
+    if entry is None:
+        return None
+    try:
+        section = json.loads(entry.value)
+    except ValueError:
+        return None  # corrupt entry behaves like a miss
+    return CachedSection(section, entry.created_at) if isinstance(section, dict) else None
+
+
+def store_section(
+    stage_name: str,
+    prompt_version: str,
+    model: str,
+    combined: bool,
+    content_fingerprint: str,
+    section: Dict[str, Any],
+) -> None:
+    """Remember a validated section for this content and analysis setup."""
+    get_cache().set(
+        CACHE_NAMESPACE,
+        _key(stage_name, prompt_version, model, combined, content_fingerprint),
+        json.dumps(section, ensure_ascii=False),
+    )
@@ -0,0 +1,42 @@
+# second_brain/content_ingestor/stages/_llm_cache.py
+"""
+Exact-match cache for LLM responses used by the analysis stages.
+
+Analysis prompts are deterministic functions of the content and are sent with
+temperature=0.0, so an identical (prompt, model, prompt_version) yields an
+equivalent response. Keys embed the prompt version: editing a prompt and
+bumping its version invalidates old entries automatically.
+
+Only responses that passed schema validation are stored (_llm_client.call_llm
+decides); reads are validated there like any fresh response.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Optional
+
+from second_brain.cache_core.sqlite_store import get_cache
+
+
+CACHE_NAMESPACE = "llm_response"
+
+
+def build_cache_key(prompt: str, model: str, prompt_version: str) -> str:
+    """Content-addressed key: 128-bit BLAKE2b over model, version and prompt."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (model, prompt_version, prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")  # separator so field boundaries cannot collide
+    return digest.hexdigest()
+
+
+def get_cached_response(prompt: str, model: str, prompt_version: str) -> Optional[str]:
+    """Return the stored response for this exact call, or None."""
+    entry = get_cache().get(CACHE_NAMESPACE, build_cache_key(prompt, model, prompt_version))
+    return entry.value if entry else None
+
+
+def store_response(prompt: str, model: str, prompt_version: str, response: str) -> None:
+    """Remember a validated response for this exact call."""
+    get_cache().set(CACHE_NAMESPACE, build_cache_key(prompt, model, prompt_version), response)
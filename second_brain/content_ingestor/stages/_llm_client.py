@@ -0,0 +1,373 @@
+# second_brain/content_ingestor/stages/_llm_client.py
+"""
+Shared LLM plumbing for the analysis stages.
+
+Responsibility:
+- One provider client per process, with a process-wide cap on in-flight calls
+- Retry with backoff on transient provider errors
+- Strict structured-output format from each stage's pydantic response model
+- Streamed responses, cut off once a complete JSON object has arrived
+- Exact-match response cache (_llm_cache) and single-pass validation
+
+Prompts, response models and StageResults stay in the stages; this module
+only turns a prompt into a validated response model instance.
+
+Failure behavior: json.JSONDecodeError for malformed output, ValidationError
+for schema violations, RuntimeError (TransientLLMError when retryable) for
+provider failures. Nothing is caught here that a stage must report.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import SchemaValidator
+
+from second_brain.content_ingestor.stages import _llm_cache
+
+try:
+    from xai import GrokClient  # hypothetical provider SDK
+except ImportError:  # stages report llm_invocation_failed instead of failing at import
+    GrokClient = None
+
+
+# Upper bound on in-flight provider calls across all analysis stages. The
+# runner executes structure and semantics concurrently; this keeps bursts
+# (e.g. several pipelines in one process) within provider rate limits.
+MAX_CONCURRENT_LLM_CALLS = 4
+_llm_slots = threading.BoundedSemaphore(MAX_CONCURRENT_LLM_CALLS)
+
+
+def llm_slots_free(required: int) -> bool:
+    """
+    True if at least `required` _llm_slots are free right now (never blocks).
+
+    Probes by taking the permits non-blockingly and handing them all back, so
+    callers with lower priority can yield to online calls holding the slots.
+    """
+    acquired = 0
+    try:
+        while acquired < required and _llm_slots.acquire(blocking=False):
+            acquired += 1
+        return acquired == required
+    finally:
+        for _ in range(acquired):
+            _llm_slots.release()
+
+# Retry policy for transient provider errors (rate limits, 5xx, timeouts,
+# dropped connections): exponential backoff capped at LLM_RETRY_MAX_DELAY_S,
+# plus up to 1s of jitter so concurrent callers do not retry in lockstep.
+MAX_LLM_ATTEMPTS = 5
+LLM_RETRY_BASE_DELAY_S = 1.0
+LLM_RETRY_MAX_DELAY_S = 30.0
+TRANSIENT_STATUS_CODES = frozenset({408, 409, 429, 500, 502, 503, 504})
+# SDK/transport exception classes treated as transient, matched by name so no
+# provider or HTTP library has to be imported here
+TRANSIENT_ERROR_NAMES = frozenset({
+    "APIConnectionError",
+    "APITimeoutError",
+    "ConnectError",
+    "ConnectTimeout",
+    "RateLimitError",
+    "ReadTimeout",
+    "RemoteProtocolError",
+    "TimeoutException",
+})
+
+# Separates the static instruction block from per-video content in every prompt
+PROMPT_SEPARATOR = "\n\n---\n\n"
+
+
+def parse_response(raw_response: str, validator: SchemaValidator) -> Any:
+    """
+    Parse and validate an LLM response in one pass (pydantic-core's JSON parser).
+    Returns the model instance the validator was compiled for.
+
+    Malformed JSON is re-raised as json.JSONDecodeError so stages keep
+    reporting it separately from schema violations (ValidationError).
+    """
+    try:
+        return validator.validate_json(raw_response)
+    except ValidationError as exc:
+        errors = exc.errors(include_url=False)
+        if errors and errors[0]["type"] == "json_invalid":
+            raise json.JSONDecodeError(errors[0]["msg"], raw_response, 0) from exc
+        raise
+
+
+@dataclass(frozen=True)
+class LLMCall:
+    """Everything one provider call needs."""
+    prompt: str
+    model: str
+    max_tokens: int
+    cache_prefix_len: Optional[int] = None
+    response_format: Optional[Dict[str, Any]] = None
+
+
+def call_llm(
+    prompt: str,
+    *,
+    prompt_version: str,
+    response_model: type[BaseModel],
+    model: str,
+    max_tokens: int,
+    use_cache: bool = True,
+    cache_prefix_len: Optional[int] = None,
+    retry_warnings: Optional[List[str]] = None,
+) -> Any:
+    """
+    Isolated LLM invocation with an exact-match response cache.
+
+    Returns the response validated as a response_model instance: the text is
+    parsed and validated exactly once (parse_response), whether it came from
+    the cache or the provider. On a cache hit no network call is made. On a
+    miss the model is called, and the response is stored only after it has
+    validated — malformed output is never cached.
+    cache_prefix_len marks where the static instruction block ends; it is sent
+    as its own system message so the provider can cache it across videos.
+    response_model's JSON schema is sent as a strict structured-output format,
+    so the provider constrains decoding to that shape.
+    Safe to call from concurrent stage threads; at most
+    MAX_CONCURRENT_LLM_CALLS provider calls are in flight at once.
+    Transient provider errors are retried with backoff (MAX_LLM_ATTEMPTS);
+    each retry is recorded in retry_warnings when given.
+    Raises json.JSONDecodeError / ValidationError for invalid output, and
+    RuntimeError if the LLM call fails permanently or retries run out.
+    """
+    validator: SchemaValidator = response_model.__pydantic_validator__
+    if use_cache:
+        cached = _llm_cache.get_cached_response(prompt, model, prompt_version)
+        if cached is not None:
+            return parse_response(cached, validator)
+
+    call = LLMCall(
+        prompt=prompt,
+        model=model,
+        max_tokens=max_tokens,
+        cache_prefix_len=cache_prefix_len,
+        response_format=_response_format(response_model),
+    )
+    response = _invoke_with_retry(call, retry_warnings)
+    validated = parse_response(response, validator)  # raises before anything is cached
+
+    if use_cache:
+        _llm_cache.store_response(prompt, model, prompt_version, response)
+
+    return validated
+
+
+class TransientLLMError(RuntimeError):
+    """LLM call failed in a way that may succeed on retry."""
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Classify a provider/transport error as retryable."""
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    status_code = getattr(exc, "status_code", None) or getattr(getattr(exc, "response", None), "status_code", None)
+    if status_code in TRANSIENT_STATUS_CODES:
+        return True
+    return any(cls.__name__ in TRANSIENT_ERROR_NAMES for cls in type(exc).__mro__)
+
+
+def _invoke_with_retry(call: LLMCall, retry_warnings: Optional[List[str]]) -> str:
+    """
+    Provider call with exponential backoff on TransientLLMError.
+
+    This is the seam for request batching: a provider batch endpoint would
+    take LLMCall specs here, grouped across runs, instead of one
+    _invoke_llm per call. Not done while the provider has no batch API —
+    coalescing calls just to fan them out again only adds latency.
+    """
+    for attempt in range(1, MAX_LLM_ATTEMPTS + 1):
+        try:
+            with _llm_slots:
+                return _invoke_llm(call)
+        except TransientLLMError as exc:
+            if attempt == MAX_LLM_ATTEMPTS:
+                raise
+            delay = min(LLM_RETRY_MAX_DELAY_S, LLM_RETRY_BASE_DELAY_S * 2 ** (attempt - 1)) + random.uniform(0, 1)
+            if retry_warnings is not None:
+                retry_warnings.append(
+                    f"Transient LLM error on attempt {attempt}/{MAX_LLM_ATTEMPTS}, retried after {delay:.1f}s: {exc}"
+                )
+            time.sleep(delay)
+    raise AssertionError("unreachable")  # loop always returns or raises
+
+
+@functools.lru_cache(maxsize=None)
+def _response_format(response_model: type[BaseModel]) -> Dict[str, Any]:
+    """Strict structured-output spec for response_model (built once per model)."""
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": response_model.__name__,
+            "schema": _strict_schema(response_model.model_json_schema()),
+            "strict": True,
+        },
+    }
+
+
+def _strict_schema(node: Any) -> Any:
+    """
+    Adapt a pydantic JSON schema to strict structured-output rules.
+
+    Every object lists all its properties as required and forbids extras
+    (optional fields stay nullable); "title"/"default" annotations are dropped.
+    Validation still runs on our side against the pydantic model.
+    """
+    if isinstance(node, list):
+        return [_strict_schema(item) for item in node]
+    if not isinstance(node, dict):
+        return node
+    strict: Dict[str, Any] = {}
+    for key, value in node.items():
+        if key in ("title", "default"):
+            continue
+        if key in ("properties", "$defs"):
+            # Keys here are field/definition names, not schema keywords
+            strict[key] = {name: _strict_schema(sub) for name, sub in value.items()}
+        else:
+            strict[key] = _strict_schema(value)
+    if "properties" in strict:
+        strict["required"] = list(strict["properties"])
+        strict["additionalProperties"] = False
+    return strict
+
+
+def _build_messages(prompt: str, cache_prefix_len: Optional[int]) -> List[Dict[str, str]]:
+    """Split the prompt into a cacheable static system message and the per-video content."""
+    if not cache_prefix_len:
+        return [{"role": "system", "content": prompt}]
+    return [
+        {"role": "system", "content": prompt[:cache_prefix_len]},
+        {"role": "user", "content": prompt[cache_prefix_len:]},
+    ]
+
+
+# Provider client, created once per process and reused by every call so
+# connections (TCP + TLS) stay warm across calls, stages and runs.
+_client: Any = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> Any:
+    """Return the shared provider client (double-checked locking; thread-safe)."""
+    global _client  # pylint: disable=global-statement
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                if GrokClient is None:
+                    raise RuntimeError("LLM client unavailable: provider SDK (xai) not installed")
+                _client = GrokClient()
+    return _client
+
+
+class _JSONObjectEnd:
+    """
+    Incremental scanner that finds where the first top-level JSON object ends.
+
+    Tracks brace depth outside strings (with escape handling), so braces
+    inside string values do not count.
+    """
+
+    __slots__ = ("depth", "in_string", "escaped", "start")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.start: Optional[int] = None  # offset of the opening brace in the whole stream
+
+    def feed(self, text: str, offset: int) -> Optional[int]:
+        """Scan text (starting at stream offset); return the stream offset just past the closing brace."""
+        for index, char in enumerate(text):
+            if self.in_string:
+                if self.escaped:
+                    self.escaped = False
+                elif char == "\\":
+                    self.escaped = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                if self.start is not None:
+                    self.in_string = True
+            elif char == "{":
+                if self.start is None:
+                    self.start = offset + index
+                self.depth += 1
+            elif char == "}" and self.start is not None:
+                self.depth -= 1
+                if self.depth == 0:
+                    return offset + index + 1
+        return None
+
+
+def _invoke_llm(call: LLMCall) -> str:
+    """
+    Raw provider call over the shared client.
+    Placeholder — replace with injectable client (OpenAI/Grok/local).
+
+    The response is streamed and the stream is closed as soon as a complete
+    top-level JSON object has arrived, so trailing tokens (chatter, padding)
+    are neither waited for nor generated. Text without a complete object is
+    returned as-is; the calling stage reports it as invalid JSON.
+    """
+    try:
+        stream = _get_client().chat.completions.create(
+            model=call.model,
+            messages=_build_messages(call.prompt, call.cache_prefix_len),
+            temperature=0.0,
+            max_tokens=call.max_tokens,
+            stream=True,
+            **({"response_format": call.response_format} if call.response_format else {}),
+        )
+        scanner = _JSONObjectEnd()
+        received: List[str] = []
+        offset = 0
+        end: Optional[int] = None
+        try:
+            for chunk in stream:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if not delta:
+                    continue
+                received.append(delta)
+                end = scanner.feed(delta, offset)
+                offset += len(delta)
+                if end is not None:
+                    break
+        finally:
+            close = getattr(stream, "close", None)
+            if close is not None:
+                close()  # cancels generation server-side when the object is complete
+        text = "".join(received)
+        if end is not None:
+            return text[scanner.start:end]
+        return text.strip()
+    except Exception as exc:
+        error_type = TransientLLMError if _is_transient(exc) else RuntimeError
+        raise error_type(f"LLM call failed: {exc}") from exc
+
+# High-Level Intent
+# _llm_client.py is the single place where analysis stages reach the LLM
+# provider. Keeping it out of any one stage means analyze_structure,
+# analyze_semantics and analyze_combined depend on it, not on each other.
+
+# Edge Cases & Failure Scenarios
+# Provider SDK not installed → RuntimeError on first call, not at import
+# Rate limit / 5xx / timeout → retried up to MAX_LLM_ATTEMPTS, each retry recorded in retry_warnings
+# Chatter around the JSON object → sliced off by the stream scanner
+# Invalid response → raised before it can reach the cache
+
+# Extension Points
+# Swap LLM (Grok, Claude, local) via dependency injection in _get_client
+# Provider batch endpoint behind _invoke_with_retry (LLMCall specs are already self-contained)
+# Provider-specific cache hints (Anthropic cache_control, OpenAI prompt_cache_key) at the prefix boundary
@@ -0,0 +1,50 @@
+# second_brain/content_ingestor/stages/_metadata_cache.py
+"""
+Local cache for yt-dlp metadata, keyed by video_id.
+
+extract_info costs hundreds of milliseconds of network and parsing per video;
+re-ingesting the same video within the TTL reuses the stored fields instead.
+Only the fields fetch_metadata maps are stored (see slim_info), so entries
+stay small and contain no stream URLs (which expire anyway).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Dict, Optional
+
+from second_brain.cache_core.sqlite_store import get_cache
+
+
+CACHE_NAMESPACE = "yt_metadata"
+
+# Metadata changes rarely (title edits, description updates); one week
+METADATA_TTL_SECONDS = 7 * 86400
+
+# Info fields consumed by fetch_metadata (chapters: short list of start/end/title dicts)
+_KEPT_FIELDS = ("title", "channel", "uploader", "duration", "timestamp", "language", "description", "tags", "chapters")
+
+
+def slim_info(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the fields fetch_metadata uses; caption maps reduced to their language codes."""
+    slim = {field: info.get(field) for field in _KEPT_FIELDS}
+    slim["subtitles"] = sorted(info.get("subtitles") or {})
+    slim["automatic_captions"] = sorted(info.get("automatic_captions") or {})
+    return slim
+
+
+def get_info(video_id: str, max_age_seconds: float = METADATA_TTL_SECONDS) -> Optional[Dict[str, Any]]:
+    """Return the cached slim info for video_id, or None on miss/expiry."""
+    entry = get_cache().get(CACHE_NAMESPACE, video_id, max_age_seconds=max_age_seconds)
+    if entry is None:
+        return None
+    try:
+        info = json.loads(entry.value)
+    except ValueError:
+        return None  # corrupt entry behaves like a miss
+    return info if isinstance(info, dict) else None
+
+
+def store_info(video_id: str, info: Dict[str, Any]) -> None:
+    """Remember the slim form of a freshly extracted info dict."""
+    get_cache().set(CACHE_NAMESPACE, video_id, json.dumps(slim_info(info), ensure_ascii=False))
@@ -0,0 +1,147 @@
+# second_brain/content_ingestor/stages/_semantic_cache.py
+"""
+Similarity cache for semantic classification of near-duplicate videos.
+
+Re-uploads, mirrored clips and same-series episodes rarely match the exact
+cache, yet their coarse classification (content type, difficulty, knowledge
+type) is the same. Each analyzed video is indexed by a vector built from its
+title and transcript opening; a new video whose vector is close enough to an
+indexed one reuses that video's semantics section instead of calling the LLM.
+
+Vectors are L2-normalized hashed bag-of-words (unigrams + bigrams): no model
+download, no native dependency, deterministic across processes. They capture
+lexical, not paraphrastic, similarity — so the default threshold is strict and
+hits are essentially re-uploads and near-verbatim copies.
+
+Entries persist in the local SQLite cache and are loaded into memory once per
+process; search is a linear scan over sparse vectors.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from second_brain.cache_core.sqlite_store import get_cache
+
+
+# One index per prompt version, so a prompt edit starts a fresh index
+CACHE_NAMESPACE_PREFIX = "semantic_index"
+
+# Hashed feature space; collisions are negligible at transcript-opening length
+EMBEDDING_DIM = 4096
+
+# Transcript opening embedded together with the title
+EMBED_TRANSCRIPT_CHARS = 1024
+
+# Minimum cosine similarity for reuse
+DEFAULT_SIMILARITY_THRESHOLD = 0.93
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+SparseVector = Dict[int, float]
+
+
+def embed(title: str, transcript: str) -> SparseVector:
+    """Normalized hashed bag-of-words vector for title + transcript opening."""
+    tokens = _TOKEN_PATTERN.findall(f"{title} {transcript[:EMBED_TRANSCRIPT_CHARS]}".lower())
+    features = tokens + [f"{first} {second}" for first, second in zip(tokens, tokens[1:])]
+
+    vector: SparseVector = {}
+    for feature in features:
+        digest = hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest()
+        index = int.from_bytes(digest[:4], "little") % EMBEDDING_DIM
+        sign = 1.0 if digest[4] & 1 else -1.0  # signed hashing keeps collisions unbiased
+        vector[index] = vector.get(index, 0.0) + sign
+
+    norm = math.sqrt(sum(weight * weight for weight in vector.values()))
+    if not norm:
+        return {}
+    return {index: weight / norm for index, weight in vector.items() if weight}
+
+
+def _cosine(left: SparseVector, right: SparseVector) -> float:
+    if len(left) > len(right):
+        left, right = right, left
+    return sum(weight * right.get(index, 0.0) for index, weight in left.items())
+
+
+class SemanticIndex:
+    """In-memory view of the persisted index; thread-safe for concurrent stages."""
+
+    def __init__(self, namespace: str) -> None:
+        self._namespace = namespace
+        self._entries: Optional[Dict[str, Tuple[SparseVector, Dict[str, Any]]]] = None
+        self._lock = threading.Lock()
+
+    def search(self, vector: SparseVector) -> Tuple[float, Optional[Dict[str, Any]]]:
+        """Return (similarity, section) of the closest indexed video, or (0.0, None)."""
+        best_similarity, best_section = 0.0, None
+        if not vector:
+            return best_similarity, best_section
+        for indexed_vector, section in self._load().values():
+            similarity = _cosine(vector, indexed_vector)
+            if similarity > best_similarity:
+                best_similarity, best_section = similarity, section
+        return best_similarity, best_section
+
+    def add(self, key: str, vector: SparseVector, section: Dict[str, Any]) -> None:
+        """Index a validated section under key (the content fingerprint)."""
+        if not vector:
+            return
+        with self._lock:
+            self._load_locked()[key] = (vector, section)
+        get_cache().set(
+            self._namespace,
+            key,
+            json.dumps({"vector": vector, "section": section}, ensure_ascii=False),
+        )
+
+    def _load(self) -> Dict[str, Tuple[SparseVector, Dict[str, Any]]]:
+        with self._lock:
+            return dict(self._load_locked())
+
+    def _load_locked(self) -> Dict[str, Tuple[SparseVector, Dict[str, Any]]]:
+        if self._entries is None:
+            entries: Dict[str, Tuple[SparseVector, Dict[str, Any]]] = {}
+            for key, entry in get_cache().entries(self._namespace):
+                try:
+                    stored = json.loads(entry.value)
+                    vector = {int(index): float(weight) for index, weight in stored["vector"].items()}
+                    entries[key] = (vector, stored["section"])
+                except (ValueError, KeyError, TypeError, AttributeError):
+                    continue  # corrupt entry behaves like a miss
+            self._entries = entries
+        return self._entries
+
+
+_INDEXES: Dict[str, SemanticIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_index(prompt_version: str) -> SemanticIndex:
+    """Return the process-wide index for prompt_version (loaded from disk on first search)."""
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(prompt_version)
+        if index is None:
+            index = _INDEXES[prompt_version] = SemanticIndex(f"{CACHE_NAMESPACE_PREFIX}:{prompt_version}")
+        return index
+
+
+# High-Level Intent
+# _semantic_cache.py extends exact-match reuse (_analysis_cache) to near-duplicate
+# videos for the coarse semantics classification. It is opt-in
+# (config["semantic_cache"]) because a hit trusts another video's labels.
+
+# Edge Cases & Failure Scenarios
+# Empty title and transcript → empty vector → never matched, never indexed
+# Cache unavailable → index loads empty; add() keeps the entry in memory only
+# Corrupt stored entry → skipped on load
+
+# Extension Points
+# Swap embed() for a sentence-embedding model (same sparse/dense cosine contract)
+# Approximate nearest-neighbour index once the corpus outgrows a linear scan
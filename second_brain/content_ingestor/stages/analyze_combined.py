@@ -0,0 +1,164 @@
+# second_brain/content_ingestor/stages/analyze_combined.py
+"""
+Shared single-call analysis for analyze_structure and analyze_semantics.
+
+Responsibility:
+- Build one prompt covering both structural extraction and semantic classification
+- Call the LLM once per pipeline run and share the validated response between both stages
+
+This module is not a pipeline stage. When config["combined_analysis"] is True,
+both analysis stages fetch their part of the response from here instead of
+issuing their own call, so the transcript is sent (and paid for) only once.
+Each stage emits its own StageResult, so diagnostics keep one entry per stage.
+
+Failure behavior: errors are raised — JSONDecodeError for malformed output,
+ValidationError for schema violations, RuntimeError for LLM failures —
+exactly like the per-stage path, and both stages see the same exception.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Dict, Mapping
+
+from pydantic import BaseModel
+
+from second_brain.content_ingestor.stages.analyze_semantics import SEMANTICS_MAX_TOKENS, SemanticsResponse
+from second_brain.content_ingestor.stages._llm_client import PROMPT_SEPARATOR, call_llm
+from second_brain.content_ingestor.stages.analyze_structure import (  # same transcript budget as structure
+    LLM_MODEL,
+    MAX_TRANSCRIPT_CHARS,
+    STRUCTURE_MAX_TOKENS,
+    StructuredResponse,
+)
+
+
+# Versioned prompt — bump COMBINED_PROMPT_VERSION on any edit (LLM cache key).
+COMBINED_PROMPT_VERSION = "v3"
+COMBINED_INSTRUCTIONS = """
+You are an expert content analyst. Analyze the YouTube video given after the "---" line (title, description, transcript, chapters).
+Produce two independent results in one JSON object.
+
+structure — extract only structural elements; do not summarize, interpret, or judge quality:
+- sections: major timed or topical sections (use chapter titles if available, else infer from headings/transitions)
+- entities: people, tools, products, frameworks, concepts, organizations mentioned
+- references: URLs, books, papers, other videos/channels explicitly mentioned
+- detected_steps: ordered procedural steps if present (e.g., tutorials)
+
+semantics — classify only these attributes, objectively and based on evidence:
+- primary_topics: 3-7 main topics (most central)
+- secondary_topics: 0-5 additional notable topics
+- content_type: one of [tutorial, explanation, interview, review, opinion, demonstration, vlog, news, entertainment, other]
+- difficulty_level: one of [beginner, intermediate, advanced]
+- knowledge_type: one of [conceptual, procedural, mixed]
+
+Rules:
+- sections: use chapter timestamps if present; otherwise null start_time
+- entities/references/steps: max 50 items each
+- no commentary, no summary
+- respond with the JSON object defined by the response schema
+""".strip()
+
+COMBINED_CONTENT_TEMPLATE = """
+Title: {title}
+Description: {description}
+
+Transcript:
+{transcript}
+
+Chapters (if available):
+{chapters}
+""".strip()
+
+COMBINED_PREFIX_LEN = len(COMBINED_INSTRUCTIONS) + len(PROMPT_SEPARATOR)
+
+# Recent runs whose payload may still be requested by the second stage
+_MAX_SHARED_RUNS = 8
+
+
+class CombinedResponse(BaseModel):
+    """Strict response model for the combined call (both halves validate together)."""
+    structure: StructuredResponse
+    semantics: SemanticsResponse
+
+    model_config = {"extra": "forbid"}
+
+
+_shared_payloads: "OrderedDict[uuid.UUID, Future[CombinedResponse]]" = OrderedDict()
+_shared_lock = threading.Lock()
+
+
+def get_combined_payload(content_object: Dict[str, Any], run_id: uuid.UUID, config: Mapping[str, Any]) -> CombinedResponse:
+    """
+    Return the validated combined response for this run, calling the LLM at most once.
+
+    The first caller for a run_id performs the call; later (or concurrent)
+    callers receive the same response or the same exception.
+    Each stage reads its own half (.structure / .semantics).
+    """
+    with _shared_lock:
+        shared = _shared_payloads.get(run_id)
+        is_owner = shared is None
+        if is_owner:
+            shared = Future()
+            _shared_payloads[run_id] = shared
+            while len(_shared_payloads) > _MAX_SHARED_RUNS:
+                _shared_payloads.popitem(last=False)
+
+    if is_owner:
+        try:
+            shared.set_result(_analyze(content_object, config))
+        except Exception as exc:  # pylint: disable=broad-except
+            shared.set_exception(exc)
+
+    return shared.result()
+
+
+def combined_model(config: Mapping[str, Any]) -> str:
+    """Model for the combined call; structure is the harder task, so it picks."""
+    return config.get("structure_model", LLM_MODEL)
+
+
+def _analyze(content_object: Dict[str, Any], config: Mapping[str, Any]) -> CombinedResponse:
+    transcript = content_object["raw"].get("transcript_text", "") or ""
+    chapters = content_object["raw"].get("chapters", [])
+    title = content_object["source"].get("title") or "No title"
+    description = content_object["raw"].get("description_text") or "No description"
+
+    if len(transcript) > MAX_TRANSCRIPT_CHARS:
+        transcript = transcript[:MAX_TRANSCRIPT_CHARS]
+        content_object["diagnostics"].setdefault("warnings", []).append("Transcript truncated for combined analysis")
+
+    prompt = COMBINED_INSTRUCTIONS + PROMPT_SEPARATOR + COMBINED_CONTENT_TEMPLATE.format(
+        title=title,
+        description=description[:2000],
+        transcript=transcript or "No transcript",
+        chapters=json.dumps(chapters, ensure_ascii=False) if chapters else "none",
+    )
+
+    return call_llm(
+        prompt,
+        prompt_version=COMBINED_PROMPT_VERSION,
+        response_model=CombinedResponse,
+        model=combined_model(config),
+        # The output budget covers both halves
+        max_tokens=config.get("structure_max_tokens", STRUCTURE_MAX_TOKENS)
+        + config.get("semantics_max_tokens", SEMANTICS_MAX_TOKENS),
+        use_cache=config.get("llm_cache", True),
+        cache_prefix_len=COMBINED_PREFIX_LEN,
+    )
+
+
+# High-Level Intent
+# analyze_combined.py trades separate prompts for one round-trip: the transcript
+# is sent once, and structure + semantics come back together. It is opt-in so
+# the default pipeline keeps one focused prompt per stage.
+
+# Edge Cases & Failure Scenarios
+# One half of the response invalid → the response fails validation once; both stages report schema_validation_failed
+# LLM error → both stages report llm_invocation_failed from the shared exception
+# Response not cached unless both halves validate (CombinedResponse)
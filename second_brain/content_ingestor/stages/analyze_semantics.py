@@ -16,8 +16,11 @@ AI usage strictly follows project guidelines:
 from __future__ import annotations
 
 import json
+import queue
+import threading
+import time
 import uuid
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Literal, Mapping, Optional, Set, Tuple
 
 from pydantic import BaseModel, Field, ValidationError, model_validator
 
@@ -26,15 +29,30 @@ from second_brain.content_ingestor.schema import (
     StageFailure,
     StageResult,
 )
-from second_brain.content_ingestor.stages.base import timer
-from second_brain.content_ingestor.stages.analyze_structure import _call_llm  # Reuse isolated call
-from second_brain.logging_core.logger import get_logger, log_event
+from second_brain.content_ingestor.stages.base import Timer
+from second_brain.content_ingestor.stages import _analysis_cache, _semantic_cache
+from second_brain.content_ingestor.stages._llm_client import (
+    MAX_CONCURRENT_LLM_CALLS,
+    PROMPT_SEPARATOR,
+    call_llm,
+    llm_slots_free,
+)
+from second_brain.logging_core.logger import RunLogger, get_logger, log_event
 import logging
 
 
-# Versioned prompt — intentional and stable
-SEMANTICS_PROMPT = """
-You are an expert content classifier. Analyze the YouTube video based on title, description, and transcript.
+# A five-field classification needs neither the largest model nor a large
+# output budget (responses are ~100-200 tokens). Overridable via
+# config["semantics_model"] / config["semantics_max_tokens"].
+SEMANTICS_MODEL = "grok-4-fast-non-reasoning"
+SEMANTICS_MAX_TOKENS = 384
+
+# Versioned prompt — intentional and stable.
+# Bump SEMANTICS_PROMPT_VERSION on any edit: it is part of the LLM cache key.
+# Static instructions first, per-video content last (maximizes provider prefix caching).
+SEMANTICS_PROMPT_VERSION = "v3"
+SEMANTICS_INSTRUCTIONS = """
+You are an expert content classifier. Analyze the YouTube video based on the title, description, and transcript given after the "---" line.
 
 Classify only these attributes:
 - primary_topics: 3-7 main topics (most central)
@@ -43,31 +61,47 @@ Classify only these attributes:
 - difficulty_level: one of [beginner, intermediate, advanced]
 - knowledge_type: one of [conceptual, procedural, mixed]
 
-Title: {title}
-Description: {description}
-Transcript sample: {transcript_sample}
-
 Rules:
 - Be objective and evidence-based
 - No commentary or summary
-- Respond with valid JSON only, exact schema:
-{
-  "primary_topics": [string],
-  "secondary_topics": [string],
-  "content_type": string,
-  "difficulty_level": string,
-  "knowledge_type": string
-}
+- Respond with the JSON object defined by the response schema
+""".strip()
+
+SEMANTICS_CONTENT_TEMPLATE = """
+Title: {title}
+Description: {description}
+Transcript sample: {transcript_sample}
 """.strip()
 
+# Length of the static prefix shared by every semantics prompt
+SEMANTICS_PREFIX_LEN = len(SEMANTICS_INSTRUCTIONS) + len(PROMPT_SEPARATOR)
+
+
+# Closed label sets. Literal validates by set membership (no regex per field)
+# and emits explicit "enum" lists in the structured-output schema.
+ContentType = Literal[
+    "tutorial",
+    "explanation",
+    "interview",
+    "review",
+    "opinion",
+    "demonstration",
+    "vlog",
+    "news",
+    "entertainment",
+    "other",
+]
+DifficultyLevel = Literal["beginner", "intermediate", "advanced"]
+KnowledgeType = Literal["conceptual", "procedural", "mixed"]
+
 
 class SemanticsResponse(BaseModel):
     """Strict validation model for semantic classification."""
     primary_topics: List[str] = Field(min_length=1, max_length=7)
     secondary_topics: List[str] = Field(default_factory=list, max_length=5)
-    content_type: str = Field(pattern="^(tutorial|explanation|interview|review|opinion|demonstration|vlog|news|entertainment|other)$")
-    difficulty_level: str = Field(pattern="^(beginner|intermediate|advanced)$")
-    knowledge_type: str = Field(pattern="^(conceptual|procedural|mixed)$")
+    content_type: ContentType
+    difficulty_level: DifficultyLevel
+    knowledge_type: KnowledgeType
 
     @model_validator(mode='after')
     def validate_primary_not_empty(self) -> 'SemanticsResponse':
@@ -78,7 +112,169 @@ class SemanticsResponse(BaseModel):
     model_config = {"extra": "forbid"}
 
 
-def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str, Any]) -> Tuple[Dict[str, Any], StageResult]:
+# Transcript sample sizes: full sample (~7-8k tokens) and compact first try
+MAX_SAMPLE_CHARS = 20000
+COMPACT_SAMPLE_CHARS = 2000
+
+# Title + description length above which the compact sample is tried first
+METADATA_SUFFICIENT_CHARS = 500
+
+# Cached classifications older than this are served as-is and refreshed in
+# the background (override: config["semantics_refresh_after_s"]).
+SEMANTICS_REFRESH_AFTER_S = 7 * 86400
+
+# Background refreshes are low priority: one runs only while at least half of
+# the shared LLM slots (_llm_client) are free (checked when scheduling and again right
+# before the call). When online calls hold more, the refresh is skipped, not
+# queued — a later cache hit schedules it again.
+REFRESH_FREE_SLOTS = max(1, MAX_CONCURRENT_LLM_CALLS // 2)
+
+# Refreshes only pay off in long-lived processes (backfills, services); a
+# one-shot CLI run would exit before the result is used.
+# Opt in via config["semantics_background_refresh"].
+DEFAULT_BACKGROUND_REFRESH = False
+
+# Refreshes run one at a time on a lazily started daemon thread, so they never
+# delay interpreter exit; a refresh lost at exit leaves the old entry in place.
+_refresh_queue: "queue.Queue[Tuple[Any, ...]]" = queue.Queue()
+_refresh_worker: Optional[threading.Thread] = None
+_refreshing: Set[str] = set()
+_refreshing_lock = threading.Lock()
+
+def _empty_semantics() -> Dict[str, Any]:
+    """Fallback semantics section (built fresh so topic lists are never shared)."""
+    return {
+        "primary_topics": [],
+        "secondary_topics": [],
+        "content_type": None,
+        "difficulty_level": None,
+        "knowledge_type": None,
+    }
+
+
+def _request_semantics(
+    title: str,
+    description: str,
+    transcript_sample: str,
+    config: Mapping[str, Any],
+    retry_warnings: List[str],
+) -> SemanticsResponse:
+    """One semantics LLM call. Raises JSONDecodeError / ValidationError / RuntimeError."""
+    prompt = SEMANTICS_INSTRUCTIONS + PROMPT_SEPARATOR + SEMANTICS_CONTENT_TEMPLATE.format(
+        title=title or "No title",
+        description=(description or "")[:2000] or "No description",
+        transcript_sample=transcript_sample or "No transcript",
+    )
+    return call_llm(
+        prompt,
+        prompt_version=SEMANTICS_PROMPT_VERSION,
+        response_model=SemanticsResponse,
+        model=config.get("semantics_model", SEMANTICS_MODEL),
+        max_tokens=config.get("semantics_max_tokens", SEMANTICS_MAX_TOKENS),
+        use_cache=config.get("llm_cache", True),
+        cache_prefix_len=SEMANTICS_PREFIX_LEN,
+        retry_warnings=retry_warnings,
+    )
+
+
+def _analysis_setup(config: Mapping[str, Any]) -> Tuple[str, str]:
+    """Prompt version and model that produce this stage's section under config (analysis cache key)."""
+    if config.get("combined_analysis", False):
+        from second_brain.content_ingestor.stages import analyze_combined
+
+        return analyze_combined.COMBINED_PROMPT_VERSION, analyze_combined.combined_model(config)
+    return SEMANTICS_PROMPT_VERSION, config.get("semantics_model", SEMANTICS_MODEL)
+
+
+def _schedule_refresh(
+    content_fingerprint: str,
+    title: str,
+    description: str,
+    transcript: str,
+    config: Mapping[str, Any],
+    logger: RunLogger,
+) -> None:
+    """Re-classify stale cached content off the request path (fire-and-forget)."""
+    global _refresh_worker  # pylint: disable=global-statement
+    if not llm_slots_free(REFRESH_FREE_SLOTS):
+        return  # online calls have priority; retried on the next hit
+    with _refreshing_lock:
+        if content_fingerprint in _refreshing:
+            return
+        _refreshing.add(content_fingerprint)
+        if _refresh_worker is None:
+            _refresh_worker = threading.Thread(target=_run_refreshes, name="semantics-refresh", daemon=True)
+            _refresh_worker.start()
+    _refresh_queue.put((content_fingerprint, title, description, transcript, config, logger))
+
+
+def _run_refreshes() -> None:
+    while True:
+        content_fingerprint, *refresh_args = _refresh_queue.get()
+        try:
+            # Capacity may have been taken while this refresh waited its turn
+            if llm_slots_free(REFRESH_FREE_SLOTS):
+                _refresh_semantics(content_fingerprint, *refresh_args)
+        finally:
+            _release_refresh(content_fingerprint)
+
+
+def _release_refresh(content_fingerprint: str) -> None:
+    with _refreshing_lock:
+        _refreshing.discard(content_fingerprint)
+
+
+def _refresh_semantics(
+    content_fingerprint: str,
+    title: str,
+    description: str,
+    transcript: str,
+    config: Mapping[str, Any],
+    logger: RunLogger,
+) -> None:
+    # The response cache would return the stale answer; bypass it for this call
+    refresh_config = {**config, "llm_cache": False}
+    try:
+        validated = _request_semantics(title, description, transcript[:MAX_SAMPLE_CHARS], refresh_config, [])
+        _analysis_cache.store_section(
+            "analyze_semantics",
+            SEMANTICS_PROMPT_VERSION,
+            refresh_config.get("semantics_model", SEMANTICS_MODEL),
+            False,
+            content_fingerprint,
+            _semantics_section(validated),
+        )
+        log_event(
+            logger,
+            logging.INFO,
+            "Stale cached semantics refreshed",
+            stage_name="analyze_semantics",
+            event_type="cache_refresh",
+        )
+    except Exception as exc:  # pylint: disable=broad-except
+        # The cached section stays in place; a later hit retries
+        log_event(
+            logger,
+            logging.WARNING,
+            "Background semantics refresh failed",
+            stage_name="analyze_semantics",
+            event_type="cache_refresh_failure",
+            metadata={"exception": str(exc)},
+        )
+
+
+def _semantics_section(validated: SemanticsResponse) -> Dict[str, Any]:
+    """Semantics section of the content object from a validated response."""
+    return {
+        "primary_topics": validated.primary_topics,
+        "secondary_topics": validated.secondary_topics,
+        "content_type": validated.content_type,
+        "difficulty_level": validated.difficulty_level,
+        "knowledge_type": validated.knowledge_type,
+    }
+
+
+def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Mapping[str, Any]) -> Tuple[Dict[str, Any], StageResult]:
     """
     Perform light semantic classification.
     """
@@ -97,21 +293,15 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
     description = content_object["raw"].get("description_text", "")
     transcript = content_object["raw"].get("transcript_text", "") or ""
 
-    with timer() as end:
+    with Timer() as stage_timer:
         # Graceful empty case
         if not transcript and not title:
-            content_object["semantics"] = {
-                "primary_topics": [],
-                "secondary_topics": [],
-                "content_type": None,
-                "difficulty_level": None,
-                "knowledge_type": None,
-            }
+            content_object["semantics"] = _empty_semantics()
             result = StageResult(
                 stage_name=stage_name,
                 success=True,
                 warnings=["Insufficient content for semantic analysis"],
-                execution_time_ms=end(),
+                execution_time_ms=stage_timer.ms(),
             )
             log_event(
                 logger,
@@ -122,34 +312,110 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
             )
             return content_object, result
 
-        # Use sample to stay within token limits
-        transcript_sample = transcript[:20000]  # ~7-8k tokens safe
-        if len(transcript) > 20000:
-            content_object["diagnostics"].setdefault("warnings", []).append("Transcript truncated for semantic analysis")
+        combined_analysis = config.get("combined_analysis", False)
+        prompt_version, analysis_model = _analysis_setup(config)
 
-        prompt = SEMANTICS_PROMPT.format(
-            title=title or "No title",
-            description=description[:2000] or "No description",
-            transcript_sample=transcript_sample or "No transcript",
-        )
+        # Unchanged input seen before → reuse the validated section, no LLM call
+        content_fingerprint = _analysis_cache.fingerprint(content_object) if config.get("llm_cache", True) else None
+        if content_fingerprint:
+            cached_section = _analysis_cache.get_section(
+                stage_name, prompt_version, analysis_model, combined_analysis, content_fingerprint
+            )
+            if cached_section is not None:
+                content_object["semantics"] = cached_section.section
+                refresh_after = config.get("semantics_refresh_after_s", SEMANTICS_REFRESH_AFTER_S)
+                # The refresh re-runs the per-stage prompt, so only per-stage entries are refreshed
+                if (
+                    not combined_analysis
+                    and config.get("semantics_background_refresh", DEFAULT_BACKGROUND_REFRESH)
+                    and time.time() - cached_section.created_at > refresh_after
+                ):
+                    _schedule_refresh(content_fingerprint, title, description, transcript, config, logger)
+                result = StageResult(
+                    stage_name=stage_name,
+                    success=True,
+                    warnings=["Semantic classification reused from cache (unchanged input)"],
+                    execution_time_ms=stage_timer.ms(),
+                )
+                log_event(
+                    logger,
+                    logging.INFO,
+                    "Semantic classification reused from cache",
+                    stage_name=stage_name,
+                    event_type="success",
+                    metadata={"prompt_tier": "cached"},
+                )
+                return content_object, result
+
+        # Near-duplicate of an analyzed video (re-upload, mirror) → reuse its labels
+        semantic_vector = _semantic_cache.embed(title or "", transcript) if config.get("semantic_cache", False) else None
+        if semantic_vector:
+            similarity, similar_section = _semantic_cache.get_index(SEMANTICS_PROMPT_VERSION).search(semantic_vector)
+            threshold = config.get("semantic_cache_threshold", _semantic_cache.DEFAULT_SIMILARITY_THRESHOLD)
+            if similar_section is not None and similarity >= threshold:
+                content_object["semantics"] = dict(similar_section)
+                result = StageResult(
+                    stage_name=stage_name,
+                    success=True,
+                    warnings=[f"Semantic classification reused from similar video (similarity={similarity:.3f})"],
+                    execution_time_ms=stage_timer.ms(),
+                )
+                log_event(
+                    logger,
+                    logging.INFO,
+                    "Semantic classification reused from similar video",
+                    stage_name=stage_name,
+                    event_type="success",
+                    metadata={"prompt_tier": "similar", "similarity": round(similarity, 3)},
+                )
+                return content_object, result
+
+        stage_warnings: List[str] = []
+        prompt_tier = "combined" if combined_analysis else "full"
 
         try:
-            raw_response = _call_llm(prompt)
-            parsed = json.loads(raw_response)
-            validated = SemanticsResponse.model_validate(parsed)
-
-            content_object["semantics"] = {
-                "primary_topics": validated.primary_topics,
-                "secondary_topics": validated.secondary_topics,
-                "content_type": validated.content_type,
-                "difficulty_level": validated.difficulty_level,
-                "knowledge_type": validated.knowledge_type,
-            }
+            if combined_analysis:
+                # One LLM call shared with analyze_structure
+                from second_brain.content_ingestor.stages import analyze_combined
+
+                validated = analyze_combined.get_combined_payload(content_object, run_id, config).semantics
+            else:
+                validated = None
+                # A substantial title + description usually settles content type
+                # and difficulty, so a short transcript sample is tried first;
+                # the full sample is sent only if that response fails validation.
+                metadata_chars = len(title or "") + len(description or "")
+                if metadata_chars > METADATA_SUFFICIENT_CHARS and len(transcript) > COMPACT_SAMPLE_CHARS:
+                    try:
+                        validated = _request_semantics(title, description, transcript[:COMPACT_SAMPLE_CHARS], config, stage_warnings)
+                        prompt_tier = "compact"
+                    except (json.JSONDecodeError, ValidationError):
+                        stage_warnings.append("Compact semantics prompt failed validation; retried with full transcript sample")
+
+                if validated is None:
+                    # Use sample to stay within token limits
+                    if len(transcript) > MAX_SAMPLE_CHARS:
+                        content_object["diagnostics"].setdefault("warnings", []).append("Transcript truncated for semantic analysis")
+                    validated = _request_semantics(title, description, transcript[:MAX_SAMPLE_CHARS], config, stage_warnings)
+
+            content_object["semantics"] = _semantics_section(validated)
+
+            if content_fingerprint:
+                _analysis_cache.store_section(
+                    stage_name, prompt_version, analysis_model, combined_analysis, content_fingerprint, content_object["semantics"]
+                )
+            if semantic_vector:
+                _semantic_cache.get_index(SEMANTICS_PROMPT_VERSION).add(
+                    content_fingerprint or _analysis_cache.fingerprint(content_object),
+                    semantic_vector,
+                    content_object["semantics"],
+                )
 
             result = StageResult(
                 stage_name=stage_name,
                 success=True,
-                execution_time_ms=end(),
+                warnings=stage_warnings,
+                execution_time_ms=stage_timer.ms(),
             )
 
             log_event(
@@ -159,6 +425,7 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 stage_name=stage_name,
                 event_type="success",
                 metadata={
+                    "prompt_tier": prompt_tier,
                     "primary_topic_count": len(validated.primary_topics),
                     "content_type": validated.content_type,
                     "difficulty": validated.difficulty_level,
@@ -174,19 +441,14 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 impact="Semantics fields empty",
                 suggested_fixes=["Review prompt", "Update model for JSON adherence"],
             )
-            content_object["semantics"] = {
-                "primary_topics": [],
-                "secondary_topics": [],
-                "content_type": None,
-                "difficulty_level": None,
-                "knowledge_type": None,
-            }
+            content_object["semantics"] = _empty_semantics()
             result = StageResult(
                 stage_name=stage_name,
                 success=False,
                 errors=["AI returned invalid JSON"],
+                warnings=stage_warnings,
                 failures=[failure],
-                execution_time_ms=end(),
+                execution_time_ms=stage_timer.ms(),
             )
             log_event(
                 logger,
@@ -194,7 +456,7 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 "Semantics failed: invalid JSON",
                 stage_name=stage_name,
                 event_type="failure",
-                metadata={"raw_response_snippet": raw_response[:500]},
+                metadata={"raw_response_snippet": exc.doc[:500]},
             )
 
         except ValidationError as exc:
@@ -205,19 +467,14 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 impact="Semantics fields empty",
                 suggested_fixes=["Strengthen prompt constraints", "Add response repair"],
             )
-            content_object["semantics"] = {
-                "primary_topics": [],
-                "secondary_topics": [],
-                "content_type": None,
-                "difficulty_level": None,
-                "knowledge_type": None,
-            }
+            content_object["semantics"] = _empty_semantics()
             result = StageResult(
                 stage_name=stage_name,
                 success=False,
                 errors=[f"Validation failed: {exc}"],
+                warnings=stage_warnings,
                 failures=[failure],
-                execution_time_ms=end(),
+                execution_time_ms=stage_timer.ms(),
             )
 
         except Exception as exc:  # pylint: disable=broad-except
@@ -228,19 +485,14 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 impact="Semantics fields empty",
                 suggested_fixes=["Check model availability", "Retry later"],
             )
-            content_object["semantics"] = {
-                "primary_topics": [],
-                "secondary_topics": [],
-                "content_type": None,
-                "difficulty_level": None,
-                "knowledge_type": None,
-            }
+            content_object["semantics"] = _empty_semantics()
             result = StageResult(
                 stage_name=stage_name,
                 success=False,
                 errors=[f"LLM error: {str(exc)}"],
+                warnings=stage_warnings,
                 failures=[failure],
-                execution_time_ms=end(),
+                execution_time_ms=stage_timer.ms(),
             )
             log_event(
                 logger,
@@ -286,7 +538,7 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
 
 # No transcript → success=True with empty/null fields + warning
 # Malformed JSON or invalid enum → INTERPRETATION_ERROR + fallback
-# LLM timeout/network error → INTERPRETATION_ERROR + retry suggestion
+# LLM timeout/network error → retried with backoff; if retries run out → INTERPRETATION_ERROR + retry suggestion
 # Overly vague response → validation rejects → empty fallback
 # Transcript too long → same truncation as structure stage
 
@@ -295,4 +547,8 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
 # Enum expansion (more content_types)
 # Confidence scores per field
 # Multi-model ensemble
-# Prompt A/B testing framework
\ No newline at end of file
+# Prompt A/B testing framework
+# config["combined_analysis"]: share one LLM call with analyze_structure (see analyze_combined.py)
+# config["semantic_cache"]: reuse labels of near-duplicate videos (see _semantic_cache.py)
+# config["semantics_background_refresh"]: refresh stale cached labels in the background (long-lived processes)
+# config["semantics_refresh_after_s"]: age after which cached labels are refreshed in the background
@@ -4,7 +4,7 @@ Stage 4: Structural analysis of content using AI.
 
 Responsibility:
 - Extract non-opinionated structural elements from transcript
-- Sections, entities, references, steps, code presence
+- Sections, entities, references, steps (LLM); code presence (local scan)
 - AI call isolated, prompt versioned, output validated
 
 Follows AI guidelines: prompt separate, invocation isolated, output bounded and validated.
@@ -13,8 +13,9 @@ Follows AI guidelines: prompt separate, invocation isolated, output bounded and
 from __future__ import annotations
 
 import json
+import re
 import uuid
-from typing import Any, Dict, List, Tuple, Optional
+from typing import Any, Dict, List, Tuple, Optional, Mapping
 
 from pydantic import BaseModel, Field, ValidationError
 
@@ -23,14 +24,31 @@ from second_brain.content_ingestor.schema import (
     StageFailure,
     StageResult,
 )
-from second_brain.content_ingestor.stages.base import timer
+from second_brain.content_ingestor.stages import _analysis_cache
+from second_brain.content_ingestor.stages._llm_client import PROMPT_SEPARATOR, call_llm
+from second_brain.content_ingestor.stages.base import Timer
 from second_brain.logging_core.logger import get_logger, log_event
 import logging
 
 
-# Versioned prompt — change only with justification and migration plan
-STRUCTURE_PROMPT = """
-You are an expert content analyst. Analyze the following YouTube video transcript and extract only structural elements.
+# Default model and output budget for analysis calls. Structure lists are
+# capped at 50 items (~8 tokens each), so 768 tokens covers the worst case.
+# Overridable via config["structure_model"] / config["structure_max_tokens"].
+LLM_MODEL = "grok-4"
+STRUCTURE_MAX_TOKENS = 768
+
+# Versioned prompt — change only with justification and migration plan.
+# Bump STRUCTURE_PROMPT_VERSION on any edit: it is part of the LLM cache key.
+#
+# All static text (instructions, schema, rules) comes first and the per-video
+# content last, so providers' automatic prefix caching covers the whole
+# instruction block. The instructions are never str.format()-ed, so literal
+# braces need no escaping. The response shape is not described in prose: it is
+# enforced by the provider from the response model's JSON schema
+# (structured outputs, see _llm_client._response_format).
+STRUCTURE_PROMPT_VERSION = "v4"
+STRUCTURE_INSTRUCTIONS = """
+You are an expert content analyst. Analyze the YouTube video transcript given after the "---" line and extract only structural elements.
 Do not summarize, interpret, or judge quality.
 
 Extract:
@@ -38,63 +56,136 @@ Extract:
 - entities: people, tools, products, frameworks, concepts, organizations mentioned
 - references: URLs, books, papers, other videos/channels explicitly mentioned
 - detected_steps: ordered procedural steps if present (e.g., tutorials)
-- code_blocks_present: true if any code is shown or discussed
 
+Rules:
+- sections: use chapter timestamps if present; otherwise null start_time
+- entities/references/steps: max 50 items each
+- no explanations
+- respond with the JSON object defined by the response schema
+""".strip()
+
+STRUCTURE_CONTENT_TEMPLATE = """
 Transcript:
 {transcript}
 
 Chapters (if available):
 {chapters}
+""".strip()
 
-Respond with valid JSON only, matching this schema exactly:
-{
-  "sections": [{"start_time?": number, "title": string}],
-  "entities": [string],
-  "references": [string],
-  "detected_steps": [string],
-  "code_blocks_present": boolean
-}
+# Transcript budget for the full prompt (~15k tokens)
+MAX_TRANSCRIPT_CHARS = 40000
 
-Rules:
-- sections: use chapter timestamps if present; otherwise null start_time
-- entities/references/steps: max 50 items each
-- no explanations, no markdown, no extra fields
-""".strip()
+# Head and tail excerpt size for the compact prompt used when chapters exist
+COMPACT_EXCERPT_CHARS = 2000
+
+# code_blocks_present is decided locally, not by the LLM: a deterministic scan
+# for code tokens is cheaper and cannot hallucinate. At least
+# CODE_MATCH_THRESHOLD distinct matches are required, so a single spoken
+# "import" or "print(" does not count as code.
+_CODE_PATTERN = re.compile(
+    r"(```|\bdef \w+\(|\bimport \w+|\bfunction \w+\(|console\.log|println!|\bprint\(|#include)"
+)
+CODE_MATCH_THRESHOLD = 2
+
+# Static prompt pieces, assembled once at import: prompts are built by joining
+# these with the per-video transcript and chapters (no template walk per call)
+_STRUCTURE_PREFIX = STRUCTURE_INSTRUCTIONS + PROMPT_SEPARATOR
+_TRANSCRIPT_HEAD, _CHAPTERS_BLOCK = STRUCTURE_CONTENT_TEMPLATE.split("{transcript}")
+_CHAPTERS_HEAD, _CHAPTERS_TAIL = _CHAPTERS_BLOCK.split("{chapters}")
+
+# Length of the static prefix shared by every structure prompt
+STRUCTURE_PREFIX_LEN = len(_STRUCTURE_PREFIX)
+
+
+class SectionItem(BaseModel):
+    """One structural section; start_time in seconds when known."""
+    title: str
+    start_time: Optional[float] = None
+
+    model_config = {"extra": "forbid"}
 
 
 class StructuredResponse(BaseModel):
     """Strict response model for structural analysis."""
-    sections: List[Dict[str, Any]] = Field(default_factory=list)
+    sections: List[SectionItem] = Field(default_factory=list)
     entities: List[str] = Field(default_factory=list)
     references: List[str] = Field(default_factory=list)
     detected_steps: List[str] = Field(default_factory=list)
-    code_blocks_present: bool = False
 
     model_config = {"extra": "forbid"}
 
 
-def _call_llm(prompt: str) -> str:
+
+def _empty_structure(chapters: List[Dict[str, Any]], code_present: bool) -> Dict[str, Any]:
     """
-    Isolated LLM invocation.
-    Placeholder — replace with injectable client (OpenAI/Grok/local).
+    Fallback structure section: chapter sections only, no extracted lists.
+
+    Built fresh each time (not copied from a shared constant) so the lists
+    are never shared between content objects.
     """
-    # TEMPORARY: Use Grok via import if available; otherwise raise clear error
-    try:
-        # This is a placeholder — in real system this would be injected
-        from xai import GrokClient  # hypothetical
-        client = GrokClient()
-        response = client.chat.completions.create(
-            model="grok-4",
-            messages=[{"role": "system", "content": prompt}],
-            temperature=0.0,
-            max_tokens=1024,
-        )
-        return response.choices[0].message.content.strip()
-    except Exception as exc:
-        raise RuntimeError(f"LLM call failed: {exc}") from exc
-
-
-def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str, Any]) -> Tuple[Dict[str, Any], StageResult]:
+    return {
+        "sections": chapters or [],
+        "entities": [],
+        "references": [],
+        "detected_steps": [],
+        "code_blocks_present": code_present,
+    }
+
+
+def _has_code(transcript: str) -> bool:
+    """True if the transcript contains at least CODE_MATCH_THRESHOLD distinct code tokens."""
+    seen = set()
+    for match in _CODE_PATTERN.finditer(transcript):
+        seen.add(match.group(0))
+        if len(seen) >= CODE_MATCH_THRESHOLD:
+            return True
+    return False
+
+
+def _head_and_tail(transcript: str) -> str:
+    """Opening and closing excerpt of a long transcript (intro and wrap-up carry most references)."""
+    return transcript[:COMPACT_EXCERPT_CHARS] + "\n[...]\n" + transcript[-COMPACT_EXCERPT_CHARS:]
+
+
+def _serialize_chapters(chapters: List[Dict[str, Any]]) -> str:
+    """Chapter list as it appears in the prompt (computed once per stage run)."""
+    return json.dumps(chapters, ensure_ascii=False) if chapters else "none"
+
+
+def _build_structure_prompt(transcript: str, chapters_json: str) -> str:
+    """Static instructions followed by the per-video transcript (or excerpt) and chapters."""
+    return "".join((_STRUCTURE_PREFIX, _TRANSCRIPT_HEAD, transcript, _CHAPTERS_HEAD, chapters_json, _CHAPTERS_TAIL))
+
+
+def _request_structure(
+    transcript: str,
+    chapters_json: str,
+    config: Mapping[str, Any],
+    retry_warnings: List[str],
+) -> StructuredResponse:
+    """One structure LLM call. Raises JSONDecodeError / ValidationError / RuntimeError."""
+    return call_llm(
+        _build_structure_prompt(transcript, chapters_json),
+        prompt_version=STRUCTURE_PROMPT_VERSION,
+        response_model=StructuredResponse,
+        model=config.get("structure_model", LLM_MODEL),
+        max_tokens=config.get("structure_max_tokens", STRUCTURE_MAX_TOKENS),
+        use_cache=config.get("llm_cache", True),
+        cache_prefix_len=STRUCTURE_PREFIX_LEN,
+        retry_warnings=retry_warnings,
+    )
+
+
+def _analysis_setup(config: Mapping[str, Any]) -> Tuple[str, str]:
+    """Prompt version and model that produce this stage's section under config (analysis cache key)."""
+    if config.get("combined_analysis", False):
+        from second_brain.content_ingestor.stages import analyze_combined
+
+        return analyze_combined.COMBINED_PROMPT_VERSION, analyze_combined.combined_model(config)
+    return STRUCTURE_PROMPT_VERSION, config.get("structure_model", LLM_MODEL)
+
+
+def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Mapping[str, Any]) -> Tuple[Dict[str, Any], StageResult]:
     """
     Perform structural analysis on available transcript.
     """
@@ -112,21 +203,15 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
     transcript = content_object["raw"].get("transcript_text", "") or ""
     chapters = content_object["raw"].get("chapters", [])
 
-    with timer() as end:
+    with Timer() as stage_timer:
         if not transcript:
             # Graceful empty result
-            content_object["structure"] = {
-                "sections": chapters or [],
-                "entities": [],
-                "references": [],
-                "detected_steps": [],
-                "code_blocks_present": False,
-            }
+            content_object["structure"] = _empty_structure(chapters, False)
             result = StageResult(
                 stage_name=stage_name,
                 success=True,
                 warnings=["No transcript available for structural analysis"],
-                execution_time_ms=end(),
+                execution_time_ms=stage_timer.ms(),
             )
             log_event(
                 logger,
@@ -137,35 +222,84 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
             )
             return content_object, result
 
-        # Truncate if excessively long (protect token limits)
-        if len(transcript) > 40000:  # ~15k tokens safe buffer
-            transcript = transcript[:40000]
-            content_object["diagnostics"].setdefault("warnings", []).append("Transcript truncated for structural analysis")
+        # Deterministic, from the full transcript (before any truncation)
+        code_present = _has_code(transcript)
 
-        prompt = STRUCTURE_PROMPT.format(
-            transcript=transcript,
-            chapters=json.dumps(chapters, ensure_ascii=False) if chapters else "none",
-        )
+        combined_analysis = config.get("combined_analysis", False)
+        prompt_version, analysis_model = _analysis_setup(config)
 
-        try:
-            raw_response = _call_llm(prompt)
+        # Unchanged input seen before → reuse the validated section, no LLM call
+        content_fingerprint = _analysis_cache.fingerprint(content_object) if config.get("llm_cache", True) else None
+        if content_fingerprint:
+            cached_section = _analysis_cache.get_section(
+                stage_name, prompt_version, analysis_model, combined_analysis, content_fingerprint
+            )
+            if cached_section is not None:
+                content_object["structure"] = cached_section.section
+                result = StageResult(
+                    stage_name=stage_name,
+                    success=True,
+                    warnings=["Structural analysis reused from cache (unchanged input)"],
+                    execution_time_ms=stage_timer.ms(),
+                )
+                log_event(
+                    logger,
+                    logging.INFO,
+                    "Structural analysis reused from cache",
+                    stage_name=stage_name,
+                    event_type="success",
+                    metadata={"prompt_tier": "cached"},
+                )
+                return content_object, result
+
+        stage_warnings: List[str] = []
+        prompt_tier = "combined" if combined_analysis else "full"
 
-            # Parse and validate
-            parsed = json.loads(raw_response)
-            validated = StructuredResponse.model_validate(parsed)
+        try:
+            if combined_analysis:
+                # One LLM call shared with analyze_semantics
+                from second_brain.content_ingestor.stages import analyze_combined
+
+                validated = analyze_combined.get_combined_payload(content_object, run_id, config).structure
+            else:
+                validated = None
+                # Shared by both prompt tiers
+                chapters_json = _serialize_chapters(chapters)
+                # Chapters already provide the sections, so a head+tail excerpt
+                # usually suffices for entities/references. The full transcript
+                # is sent only if the compact response fails validation.
+                if chapters and len(transcript) > 2 * COMPACT_EXCERPT_CHARS:
+                    try:
+                        validated = _request_structure(_head_and_tail(transcript), chapters_json, config, stage_warnings)
+                        prompt_tier = "compact"
+                    except (json.JSONDecodeError, ValidationError):
+                        stage_warnings.append("Compact structure prompt failed validation; retried with full transcript")
+
+                if validated is None:
+                    # Truncate if excessively long (protect token limits)
+                    if len(transcript) > MAX_TRANSCRIPT_CHARS:  # ~15k tokens safe buffer
+                        transcript = transcript[:MAX_TRANSCRIPT_CHARS]
+                        content_object["diagnostics"].setdefault("warnings", []).append("Transcript truncated for structural analysis")
+                    validated = _request_structure(transcript, chapters_json, config, stage_warnings)
 
             content_object["structure"] = {
-                "sections": validated.sections or (chapters or []),
+                "sections": [section.model_dump() for section in validated.sections] or (chapters or []),
                 "entities": validated.entities,
                 "references": validated.references,
                 "detected_steps": validated.detected_steps,
-                "code_blocks_present": validated.code_blocks_present,
+                "code_blocks_present": code_present,
             }
 
+            if content_fingerprint:
+                _analysis_cache.store_section(
+                    stage_name, prompt_version, analysis_model, combined_analysis, content_fingerprint, content_object["structure"]
+                )
+
             result = StageResult(
                 stage_name=stage_name,
                 success=True,
-                execution_time_ms=end(),
+                warnings=stage_warnings,
+                execution_time_ms=stage_timer.ms(),
             )
 
             log_event(
@@ -175,10 +309,11 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 stage_name=stage_name,
                 event_type="success",
                 metadata={
+                    "prompt_tier": prompt_tier,
                     "entity_count": len(validated.entities),
                     "reference_count": len(validated.references),
                     "step_count": len(validated.detected_steps),
-                    "code_present": validated.code_blocks_present,
+                    "code_present": code_present,
                 },
             )
 
@@ -190,19 +325,14 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 impact="Structural fields empty; raw response preserved in logs",
                 suggested_fixes=["Review prompt", "Update model", "Add response repair logic"],
             )
-            content_object["structure"] = {
-                "sections": chapters or [],
-                "entities": [],
-                "references": [],
-                "detected_steps": [],
-                "code_blocks_present": False,
-            }
+            content_object["structure"] = _empty_structure(chapters, code_present)
             result = StageResult(
                 stage_name=stage_name,
                 success=False,
                 errors=["AI returned invalid JSON"],
+                warnings=stage_warnings,
                 failures=[failure],
-                execution_time_ms=end(),
+                execution_time_ms=stage_timer.ms(),
             )
             log_event(
                 logger,
@@ -210,7 +340,7 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 "Structural analysis failed: invalid JSON",
                 stage_name=stage_name,
                 event_type="failure",
-                metadata={"raw_response": raw_response[:1000]},
+                metadata={"raw_response": exc.doc[:1000]},
             )
 
         except ValidationError as exc:
@@ -221,19 +351,14 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 impact="Structural fields empty",
                 suggested_fixes=["Adjust prompt for stricter adherence", "Add fallback parsing"],
             )
-            content_object["structure"] = {
-                "sections": chapters or [],
-                "entities": [],
-                "references": [],
-                "detected_steps": [],
-                "code_blocks_present": False,
-            }
+            content_object["structure"] = _empty_structure(chapters, code_present)
             result = StageResult(
                 stage_name=stage_name,
                 success=False,
                 errors=[f"Validation error: {exc}"],
+                warnings=stage_warnings,
                 failures=[failure],
-                execution_time_ms=end(),
+                execution_time_ms=stage_timer.ms(),
             )
 
         except Exception as exc:  # pylint: disable=broad-except
@@ -244,19 +369,14 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 impact="Structural fields empty",
                 suggested_fixes=["Check API key/model availability", "Retry later"],
             )
-            content_object["structure"] = {
-                "sections": chapters or [],
-                "entities": [],
-                "references": [],
-                "detected_steps": [],
-                "code_blocks_present": False,
-            }
+            content_object["structure"] = _empty_structure(chapters, code_present)
             result = StageResult(
                 stage_name=stage_name,
                 success=False,
                 errors=[f"LLM call failed: {str(exc)}"],
+                warnings=stage_warnings,
                 failures=[failure],
-                execution_time_ms=end(),
+                execution_time_ms=stage_timer.ms(),
             )
             log_event(
                 logger,
@@ -279,13 +399,13 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
 #     Extract named entities (people, tools, concepts, organizations)
 #     Extract references (URLs, books, papers, other videos)
 #     Detect ordered steps or procedures
-#     Detect presence of code blocks
+#     Detect presence of code blocks (locally, _has_code)
 
 # This stage is deliberately descriptive, not interpretive — no judgment of quality or topic.
 # AI usage follows project rules: prompt isolated and versioned, call isolated, output strictly validated, bounded, and explainable.
 # Architecture
 
-#     Prompt defined as module-level constant (versioned)
+#     Prompt defined as module-level constants (versioned): static instructions first, per-video content last
 #     AI call abstracted (current placeholder: OpenAI gpt-4o-mini; future injectable)
 #     Structured JSON output enforced via Pydantic response model
 #     Validation: required fields present, lists bounded (<50 items), no empty strings
@@ -296,8 +416,7 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
 
 # content_object → raw.transcript_text (or empty if missing) + raw.chapters
 # → build prompt
-# → call LLM → raw response
-# → parse & validate → StructuredResponse model
+# → call LLM (or cache) → parse & validate once → StructuredResponse model
 # → populate content_object["structure"]
 # → StageResult (success=False only on unrecoverable parse error)
 # Edge Cases & Failure Scenarios
@@ -310,7 +429,8 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
 
 # Extension Points
 
-#     Swap LLM (Grok, Claude, local) via dependency injection
+#     Swap LLM (Grok, Claude, local) via dependency injection (_llm_client.py)
+#     config["combined_analysis"]: share one LLM call with analyze_semantics (see analyze_combined.py)
 #     Add RAG over transcript chunks for longer videos
 #     Versioned prompt registry
-#     Cache results by content_id
+#     Cache results by content_id (exact-match prompt cache already in _llm_client.call_llm)
@@ -4,7 +4,7 @@ Shared base definitions and utilities for all pipeline stages.
 
 This module defines:
 - The Stage function contract
-- A lightweight timer for consistent execution_time_ms measurement
+- A lightweight Timer for consistent execution_time_ms measurement
 
 All stages MUST conform to the defined interface.
 No business logic belongs here.
@@ -14,45 +14,47 @@ from __future__ import annotations
 
 import time
 import uuid
-from contextlib import contextmanager
-from typing import Any, Callable, Dict, Tuple, TypeAlias
+from typing import Any, Callable, Dict, Mapping, Tuple, TypeAlias
 
 from second_brain.content_ingestor.schema import StageResult
 
 
-Stage: TypeAlias = Callable[[Dict[str, Any], uuid.UUID], Tuple[Dict[str, Any], StageResult]]
+Stage: TypeAlias = Callable[[Dict[str, Any], uuid.UUID, Mapping[str, Any]], Tuple[Dict[str, Any], StageResult]]
 """
 Type alias for stage functions.
 
 Signature:
-    stage(content_object: dict, run_id: uuid.UUID) -> (updated_content_object: dict, StageResult)
+    stage(content_object: dict, run_id: uuid.UUID, config: Mapping) -> (updated_content_object: dict, StageResult)
+
+config is read-only: the runner passes the same mapping to every stage.
 """
 
 
-@contextmanager
-def timer() -> Callable[[], float]:
+class Timer:
     """
-    Context manager that provides a stop() function returning elapsed time in milliseconds.
+    Stage timer: records a start on entry, reports elapsed milliseconds on demand.
 
     Usage:
-        with timer() as end:
+        with Timer() as stage_timer:
             # do work
-            pass
-        execution_time_ms = end()
+            execution_time_ms = stage_timer.ms()
 
-    Returns:
-        A callable that returns elapsed milliseconds since entry.
+    Integer nanosecond counters avoid float precision loss on long stages;
+    a plain class avoids the generator frame of a @contextmanager.
     """
-    start = time.perf_counter()
 
-    def end() -> float:
-        return (time.perf_counter() - start) * 1000
+    __slots__ = ("start",)
+
+    def __enter__(self) -> "Timer":
+        self.start = time.perf_counter_ns()
+        return self
 
-    try:
-        yield end
-    finally:
-        pass  # No-op — caller must invoke end() if they want the time
+    def __exit__(self, *exc_info: Any) -> None:
+        return None
 
+    def ms(self) -> float:
+        """Milliseconds elapsed since entry."""
+        return (time.perf_counter_ns() - self.start) / 1e6
 
 
 #     High-Level Intent
@@ -62,7 +64,7 @@ def timer() -> Callable[[], float]:
 
 #     Every stage function receives a mutable content_object: dict and a run_id: uuid.UUID.
 #     Every stage returns a tuple (updated_content_object: dict, StageResult).
-#     Helper timer context manager standardizes execution_time_ms measurement.
+#     Timer context manager standardizes execution_time_ms measurement.
 #     No business logic lives here — only contract enforcement and shared diagnostics tools.
 
 # This ensures:
@@ -74,12 +76,12 @@ def timer() -> Callable[[], float]:
 # Architecture
 
 #     Stage type alias for clarity in type hints.
-#     timer() context manager: lightweight, no external deps.
+#     Timer context manager: slotted class, perf_counter_ns, no external deps.
 #     Docstrings emphasize contract — violations are bugs.
 
 # Data Flow
 
-# Runner → calls stage function → stage uses timer → processes → returns updated dict + StageResult.
+# Runner → calls stage function → stage uses Timer → processes → returns updated dict + StageResult.
 # Edge Cases & Failure Scenarios
 
 #     Stage raises exception → must be caught by stage implementation (converted to StageResult with failure).
@@ -89,4 +91,3 @@ def timer() -> Callable[[], float]:
 # Extension Points
 
 #     Add shared utilities (e.g., prompt versioning) here later.
-#     Replace timer with higher-precision if needed.
@@ -4,7 +4,7 @@ Stage 2: Fetch YouTube metadata using yt-dlp.
 
 Responsibility:
 - Extract title, channel, duration, publish date, language, caption availability
-- Extract description and tags (lossless raw)
+- Extract description, tags and chapters (lossless raw)
 - Handle network/transient errors gracefully with SOURCE_ERROR diagnostics
 
 Requires yt-dlp>=2023.07.06 (handles modern YouTube changes).
@@ -13,9 +13,13 @@ No media is downloaded.
 
 from __future__ import annotations
 
+import asyncio
+import atexit
+import threading
 import uuid
-from datetime import datetime
-from typing import Any, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
 
 import yt_dlp
 
@@ -24,7 +28,8 @@ from second_brain.content_ingestor.schema import (
     StageFailure,
     StageResult,
 )
-from second_brain.content_ingestor.stages.base import timer
+from second_brain.content_ingestor.stages import _metadata_cache
+from second_brain.content_ingestor.stages.base import Timer
 from second_brain.logging_core.logger import get_logger, log_event
 import logging
 
@@ -35,14 +40,219 @@ YDL_PARAMS = {
     "extract_flat": False,
     "skip_download": True,
     "no_playlist": True,
-    "extractor_args": {"youtubetab": {"skip": ["webpage"]}},  # Faster metadata only
+    "extractor_args": {
+        # mediaconnect answers with one JSON API call instead of a webpage
+        # scrape; its lack of usable format URLs is irrelevant here
+        "youtube": {"player_client": ["mediaconnect"]},
+        "youtubetab": {"skip": ["webpage"]},  # Faster metadata only
+    },
 }
 
+# Default player clients, used when the fast client leaves fields empty
+FALLBACK_YDL_PARAMS = {
+    **YDL_PARAMS,
+    "extractor_args": {"youtubetab": {"skip": ["webpage"]}},
+}
+
+# Fields whose absence is more likely a client limitation than a property of the video
+ESSENTIAL_INFO_FIELDS = ("title", "duration")
+
+
+# Concurrent extractions in process_many (config["metadata_concurrency"]);
+# the real ceiling is YouTube's rate limiting, not local resources
+DEFAULT_METADATA_CONCURRENCY = 8
+
+# Returns the YoutubeDL instance to extract with (created on first call)
+YDLFactory = Callable[[], "yt_dlp.YoutubeDL"]
+
+# Idle instances kept per pool. Above this (a burst of concurrent batches)
+# returned instances are closed instead of kept.
+MAX_IDLE_YDLS = DEFAULT_METADATA_CONCURRENCY
+
+
+class _YDLPool:
+    """
+    Long-lived YoutubeDL instances for one params set, shared across runs.
+
+    Construction (extractor registry, cookie jar, HTTP handlers) and open
+    connections are paid once per instance, not per batch. An instance is not
+    thread-safe, so it is checked out by one batch at a time; the pool is
+    module-level and owns its instances, so it does not depend on which
+    executor (or event loop) the caller runs on. close() closes every idle
+    instance; it runs at exit.
+    """
+
+    def __init__(self, params: Dict[str, Any]) -> None:
+        self._params = params
+        self._idle: List["yt_dlp.YoutubeDL"] = []
+        self._lock = threading.Lock()
+
+    def acquire(self) -> "yt_dlp.YoutubeDL":
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        return yt_dlp.YoutubeDL(self._params)
+
+    def release(self, ydl: "yt_dlp.YoutubeDL") -> None:
+        with self._lock:
+            if len(self._idle) < MAX_IDLE_YDLS:
+                self._idle.append(ydl)
+                return
+        ydl.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for ydl in idle:
+            ydl.close()
+
+
+class _Lease:
+    """YDLFactory over a pool: checks an instance out on first call, returns it on release()."""
+
+    def __init__(self, pool: _YDLPool) -> None:
+        self._pool = pool
+        self._ydl: Optional["yt_dlp.YoutubeDL"] = None
+
+    def __call__(self) -> "yt_dlp.YoutubeDL":
+        if self._ydl is None:
+            self._ydl = self._pool.acquire()
+        return self._ydl
+
+    def release(self) -> None:
+        if self._ydl is not None:
+            self._pool.release(self._ydl)
+            self._ydl = None
+
+
+_ydl_pool = _YDLPool(YDL_PARAMS)
+_fallback_ydl_pool = _YDLPool(FALLBACK_YDL_PARAMS)
+
 
-def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str, Any]) -> Tuple[Dict[str, Any], StageResult]:
+@atexit.register
+def _close_ydls() -> None:
+    _ydl_pool.close()
+    _fallback_ydl_pool.close()
+
+
+def _warm_transcription_model() -> None:
+    """Load the audio-fallback model in a background thread (import included)."""
+    def load() -> None:
+        try:
+            from second_brain.transcription.whisper import warm_model
+        except ImportError:
+            return  # fetch_transcript reports the missing dependency
+        warm_model()
+
+    threading.Thread(target=load, name="whisper-warmup", daemon=True).start()
+
+
+def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Mapping[str, Any]) -> Tuple[Dict[str, Any], StageResult]:
     """
     Fetch metadata for the validated video_id.
     """
+    return process_batch([content_object], run_id, config)[0]
+
+
+def process_batch(
+    content_objects: Sequence[Dict[str, Any]],
+    run_id: uuid.UUID,
+    config: Mapping[str, Any],
+) -> List[Tuple[Dict[str, Any], StageResult]]:
+    """
+    Fetch metadata for several content objects with one YoutubeDL instance.
+
+    Reusing the instance keeps its HTTP handlers (and their keep-alive
+    connections) across videos instead of paying TCP/TLS setup per video.
+    The instance is checked out of the module pool (so later runs reuse it
+    too) only if some video misses the metadata cache, and is returned when
+    the batch is done. Results are returned in input order, one StageResult
+    per object.
+    """
+    get_ydl = _Lease(_ydl_pool)
+    get_fallback_ydl = _Lease(_fallback_ydl_pool)
+    try:
+        return [
+            _process_one(content_object, run_id, config, get_ydl, get_fallback_ydl)
+            for content_object in content_objects
+        ]
+    finally:
+        get_ydl.release()
+        get_fallback_ydl.release()
+
+
+async def process_many(
+    content_objects: Sequence[Dict[str, Any]],
+    run_id: uuid.UUID,
+    config: Mapping[str, Any],
+) -> List[Tuple[Dict[str, Any], StageResult]]:
+    """
+    Fetch metadata for several content objects concurrently.
+
+    Extractions are network-bound, so they fan out over a bounded thread pool.
+    A YoutubeDL instance is not safe to share between threads: each video
+    checks one out of the module pool (process()), so at most max_workers are
+    in use at once and all of them stay pooled for later runs. Results keep
+    input order.
+    """
+    if not content_objects:
+        return []
+
+    max_workers = min(config.get("metadata_concurrency", DEFAULT_METADATA_CONCURRENCY), len(content_objects))
+    loop = asyncio.get_running_loop()
+    with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="fetch-metadata") as pool:
+        outcomes = await asyncio.gather(
+            *(
+                loop.run_in_executor(pool, process, content_object, run_id, config)
+                for content_object in content_objects
+            )
+        )
+    return list(outcomes)
+
+
+def _extract_info(get_ydl: YDLFactory, get_fallback_ydl: YDLFactory, url: str) -> Optional[Dict[str, Any]]:
+    """
+    Extract with the fast player client, re-extracting with the default clients if it fell short.
+
+    Falling short means a failed extraction or an empty ESSENTIAL_INFO_FIELDS
+    entry. Captions are read from the same player response by every client, so
+    a captionless result is taken as is. Only partial or failed results pay
+    the second call; a failure of the default clients is the one reported.
+    """
+    try:
+        info = get_ydl().extract_info(url, download=False)
+    except yt_dlp.DownloadError:
+        info = None
+    if info and all(info.get(field) for field in ESSENTIAL_INFO_FIELDS):
+        return info
+
+    fallback_info = get_fallback_ydl().extract_info(url, download=False)
+    if not fallback_info:
+        return info
+    if not info:
+        return fallback_info
+    # Keep what the fast client found; fill only the gaps
+    return {**fallback_info, **{key: value for key, value in info.items() if value}}
+
+
+def _map_chapters(chapters: Optional[List[Dict[str, Any]]]) -> Optional[List[Dict[str, Any]]]:
+    """yt-dlp chapters as structure sections: title plus start_time in seconds."""
+    if not chapters:
+        return None
+    return [
+        {"title": chapter.get("title") or "", "start_time": chapter.get("start_time")}
+        for chapter in chapters
+    ]
+
+
+def _process_one(
+    content_object: Dict[str, Any],
+    run_id: uuid.UUID,
+    config: Mapping[str, Any],
+    get_ydl: YDLFactory,
+    get_fallback_ydl: YDLFactory,
+) -> Tuple[Dict[str, Any], StageResult]:
+    """Fetch and map metadata for one content object, extracting via get_ydl() on a cache miss."""
     stage_name = "fetch_metadata"
     logger = get_logger(run_id)
 
@@ -72,20 +282,28 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
         )
         return content_object, result
 
-    with timer() as end:
+    with Timer() as stage_timer:
         try:
-            with yt_dlp.YoutubeDL(YDL_PARAMS) as ydl:
-                info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
+            use_cache = config.get("metadata_cache", True)
+            info = _metadata_cache.get_info(video_id) if use_cache else None
+            from_cache = info is not None
+
+            if info is None:
+                info = _extract_info(get_ydl, get_fallback_ydl, f"https://www.youtube.com/watch?v={video_id}")
+
+                if not info:
+                    raise yt_dlp.DownloadError("No info returned")
 
-            if not info:
-                raise yt_dlp.DownloadError("No info returned")
+                if use_cache:
+                    _metadata_cache.store_info(video_id, info)
 
             # Source fields
             content_object["source"]["title"] = info.get("title")
             content_object["source"]["channel_name"] = info.get("channel") or info.get("uploader")
             content_object["source"]["duration_seconds"] = info.get("duration")
             content_object["source"]["published_at"] = (
-                datetime.fromtimestamp(info["timestamp"]) if info.get("timestamp") else None
+                # YouTube timestamps are UTC; no local-timezone lookup (matches Identity.created_at)
+                datetime.fromtimestamp(info["timestamp"], tz=timezone.utc) if info.get("timestamp") else None
             )
             content_object["source"]["language"] = info.get("language")
 
@@ -93,15 +311,20 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
             has_manual = bool(info.get("subtitles"))
             has_auto = bool(info.get("automatic_captions"))
             content_object["source"]["captions_available"] = has_manual or has_auto
+            if not (has_manual or has_auto) and config.get("transcribe", True):
+                # fetch_transcript will need the audio model; hide its load behind the download
+                _warm_transcription_model()
 
             # Raw lossless fields
             content_object["raw"]["description_text"] = info.get("description")
             content_object["raw"]["tags"] = info.get("tags")
+            # Creator-defined chapters: section fallback and compact-prompt trigger for analyze_structure
+            content_object["raw"]["chapters"] = _map_chapters(info.get("chapters"))
 
             result = StageResult(
                 stage_name=stage_name,
                 success=True,
-                execution_time_ms=end(),
+                execution_time_ms=stage_timer.ms(),
             )
 
             log_event(
@@ -111,6 +334,7 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 stage_name=stage_name,
                 event_type="success",
                 metadata={
+                    "from_cache": from_cache,
                     "title": info.get("title"),
                     "channel": content_object["source"]["channel_name"],
                     "duration_seconds": info.get("duration"),
@@ -141,7 +365,7 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 success=False,
                 warnings=["Metadata fetch failed"],
                 failures=[failure],
-                execution_time_ms=end(),
+                execution_time_ms=stage_timer.ms(),
             )
 
             log_event(
@@ -166,7 +390,7 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 success=False,
                 errors=[f"Unexpected error: {str(exc)}"],
                 failures=[failure],
-                execution_time_ms=end(),
+                execution_time_ms=stage_timer.ms(),
             )
 
             log_event(
@@ -186,7 +410,7 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
 # Single responsibility:
 
 # Populate source fields (title, channel_name, duration_seconds, published_at, language, captions_available)
-# Populate partial raw fields (description_text, tags)
+# Populate partial raw fields (description_text, tags, chapters)
 # Detect caption availability for downstream transcript stage
 # Fail gracefully with SOURCE_ERROR on network/API issues, providing retry suggestions
 
@@ -194,6 +418,11 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
 # Architecture
 
 # Uses yt-dlp.YoutubeDL with careful params: quiet, no downloads, no playlist
+# process_batch() shares one YoutubeDL (and its connections) across videos; process() is a batch of one
+# That YoutubeDL is checked out of a module-level pool (_YDLPool), so consecutive runs reuse it too,
+# whatever executor or event loop they run on; pooled instances are closed at exit
+# process_many() extracts concurrently on a thread pool, one pooled YoutubeDL per in-flight video
+# No captions → the whisper model is warm-loaded in the background for fetch_transcript
 # Extracts only needed fields (explicit mapping)
 # Handles common yt-dlp exceptions (DownloadError, ExtractorError)
 # Structured StageFailure with typed cause and suggested_fixes
@@ -202,7 +431,7 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
 # Data Flow
 # content_object → has source.video_id from previous stage
 # → construct info URL
-# → ydl.extract_info() → info dict
+# → ydl.extract_info() → info dict (mediaconnect client; default clients fill any gaps)
 # → map to schema fields
 # → update content_object["source"] and ["raw"]
 # → return + StageResult
@@ -218,5 +447,5 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
 # Extension Points
 
 # Inject custom ydl params (cookies, proxy) via config
-# Cache metadata locally for reprocessing
+# config["metadata_cache"]: reuse metadata fetched within the last week (see _metadata_cache.py)
 # Add thumbnail fetch later
\ No newline at end of file
@@ -6,16 +6,33 @@ Stage 3: Fetch transcript using transcription subsystem.
 from __future__ import annotations
 
 import uuid
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple, Mapping
 
 from second_brain.content_ingestor.schema import FailureType, StageFailure, StageResult
-from second_brain.content_ingestor.stages.base import timer
+from second_brain.content_ingestor.stages import _metadata_cache
+from second_brain.content_ingestor.stages.base import Timer
 from second_brain.logging_core.logger import get_logger, log_event
 from second_brain.transcription import TranscriptionConfig, transcribe
 import logging
 
 
-def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str, Any]) -> Tuple[Dict[str, Any], StageResult]:
+def _known_captions_available(content_object: Dict[str, Any], config: Mapping[str, Any]) -> Optional[bool]:
+    """
+    Caption availability if already known, else None.
+
+    fetch_metadata runs concurrently with this stage, so its result is usually
+    not in source yet; the metadata cache answers for previously seen videos.
+    """
+    source = content_object["source"]
+    captions_available = source.get("captions_available")
+    if captions_available is None and source.get("video_id") and config.get("metadata_cache", True):
+        info = _metadata_cache.get_info(source["video_id"])
+        if info is not None:
+            captions_available = bool(info.get("subtitles") or info.get("automatic_captions"))
+    return captions_available
+
+
+def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Mapping[str, Any]) -> Tuple[Dict[str, Any], StageResult]:
     """Wrapper stage for transcription."""
     stage_name = "fetch_transcript"
     logger = get_logger(run_id)
@@ -32,9 +49,10 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
     trans_config = TranscriptionConfig(
         download_audio_dir=config.get("download_audio_dir"),
         transcribe=config.get("transcribe", True),
+        captions_available=_known_captions_available(content_object, config),
     )
 
-    with timer() as end:
+    with Timer() as stage_timer:
         try:
             result = transcribe(url, trans_config)
 
@@ -51,7 +69,7 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 errors=result.errors,
                 failures=[StageFailure(stage=stage_name, type=FailureType.EXTRACTION_ERROR, cause=err, impact="Transcript limited", suggested_fixes=result.suggested_fixes) for err in result.errors],
                 suggested_fixes=result.suggested_fixes,
-                execution_time_ms=end(),
+                execution_time_ms=stage_timer.ms(),
             )
 
             log_event(
@@ -60,7 +78,11 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 "Transcription completed",
                 stage_name=stage_name,
                 event_type="success" if result.success else "failure",
-                metadata={"method": result.method, "audio_saved": bool(result.audio_path)},
+                metadata={
+                    "method": result.method,
+                    "audio_saved": bool(result.audio_path),
+                    "captions_skipped": trans_config.captions_available is False,
+                },
             )
 
         except Exception as exc:
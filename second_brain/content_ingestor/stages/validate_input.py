@@ -13,16 +13,17 @@ No external network calls — pure deterministic validation.
 
 from __future__ import annotations
 
+import functools
 import re
 import uuid
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple, Mapping
 
 from second_brain.content_ingestor.schema import (
     FailureType,
     StageFailure,
     StageResult,
 )
-from second_brain.content_ingestor.stages.base import timer
+from second_brain.content_ingestor.stages.base import Timer
 from second_brain.logging_core.logger import get_logger, log_event
 import logging
 
@@ -32,11 +33,48 @@ YOUTUBE_REGEX = re.compile(
     r"(?:https?://)?"
     r"(?:www\.)?"
     r"(?:youtube\.com|youtu\.be|youtube-nocookie\.com)"
-    r"/(?:watch\?v=|embed/|v/|shorts/)?([^&\n?#]+)"
+    r"/(?:watch\?v=|embed/|v/|shorts/)?([^&\n?#]+)",
+    re.ASCII,  # URL syntax and video ids are ASCII; skips Unicode class lookups
 )
 
+# Canonical URL shapes resolved without the regex (the vast majority of inputs)
+_FAST_PREFIXES = (
+    "https://www.youtube.com/watch?v=",
+    "http://www.youtube.com/watch?v=",
+    "https://youtube.com/watch?v=",
+    "https://youtu.be/",
+    "http://youtu.be/",
+)
+
+# Characters ending the id, as in YOUTUBE_REGEX's [^&\n?#]+ group
+_ID_TERMINATORS = "&?#\n"
+
+
+@functools.lru_cache(maxsize=4096)
+def _extract_video_id(url: str) -> Optional[str]:
+    """
+    Return the video_id in url, or None if it is not a YouTube URL.
+
+    Canonical watch and youtu.be URLs take a prefix check and slice the raw
+    text after the prefix up to the first &, ?, # or newline (no decoding);
+    everything else (embeds, shorts, missing scheme) falls back to YOUTUBE_REGEX.
+    Both paths yield the same id for canonical URLs. Pure, so memoized per URL
+    for retries and repeated runs in one process.
+    """
+    for prefix in _FAST_PREFIXES:
+        if url.startswith(prefix):
+            start = end = len(prefix)
+            while end < len(url) and url[end] not in _ID_TERMINATORS:
+                end += 1
+            if end > start:
+                return url[start:end]
+            break
+
+    match = YOUTUBE_REGEX.search(url)
+    return match.group(1).split("&")[0] if match else None  # Strip extra params if any
+
 
-def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str, Any]) -> Tuple[Dict[str, Any], StageResult]:
+def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Mapping[str, Any]) -> Tuple[Dict[str, Any], StageResult]:
     """
     Validate input URL and extract video_id.
 
@@ -45,6 +83,7 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
     """
     stage_name = "validate_input"
     logger = get_logger(run_id)
+    source = content_object["source"]  # always initialized by the runner
 
     log_event(
         logger,
@@ -52,12 +91,13 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
         "Validating YouTube URL",
         stage_name=stage_name,
         event_type="start",
-        metadata={"raw_url": content_object.get("source", {}).get("url")},
+        metadata={"raw_url": source.get("url")},
     )
 
-    with timer() as end:
-        source = content_object.get("source", {})
-        url = source.get("url", "").strip()
+    with Timer() as stage_timer:
+        url = source.get("url") or ""
+        if url and (url[0].isspace() or url[-1].isspace()):
+            url = url.strip()  # only copy when there is whitespace to remove
 
         if not url:
             failure = StageFailure(
@@ -72,7 +112,7 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 success=False,
                 errors=["No URL provided"],
                 failures=[failure],
-                execution_time_ms=end(),
+                execution_time_ms=stage_timer.ms(),
             )
             log_event(
                 logger,
@@ -83,8 +123,8 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
             )
             return content_object, result
 
-        match = YOUTUBE_REGEX.search(url)
-        if not match:
+        video_id = _extract_video_id(url)
+        if not video_id:
             failure = StageFailure(
                 stage=stage_name,
                 type=FailureType.INPUT_ERROR,
@@ -101,7 +141,7 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
                 success=False,
                 warnings=[f"URL did not match YouTube pattern: {url}"],
                 failures=[failure],
-                execution_time_ms=end(),
+                execution_time_ms=stage_timer.ms(),
             )
             log_event(
                 logger,
@@ -113,14 +153,13 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
             )
             return content_object, result
 
-        video_id = match.group(1).split("&")[0]  # Strip extra params if any
-        content_object["source"]["video_id"] = video_id
-        content_object["source"]["url"] = url  # Preserve original for traceability
+        source["video_id"] = video_id
+        source["url"] = url  # Preserve original for traceability
 
         result = StageResult(
             stage_name=stage_name,
             success=True,
-            execution_time_ms=end(),
+            execution_time_ms=stage_timer.ms(),
         )
 
         log_event(
@@ -145,11 +184,11 @@ def process(content_object: Dict[str, Any], run_id: uuid.UUID, config: Dict[str,
 # Populate source.url (normalized) and source.video_id
 # Fail fast with typed INPUT_ERROR if invalid, providing clear suggested fixes
 
-# No external calls (pure regex + string handling) → fully deterministic and instantly testable.
+# No external calls (prefix check + slice fast path, regex fallback) → fully deterministic and instantly testable.
 # Architecture
 
 # process(content_object: dict, run_id: UUID) -> (dict, StageResult)
-# Uses timer() from base.py for execution_time_ms
+# Uses Timer from base.py for execution_time_ms
 # Structured logging via log_event
 # Returns partial success if URL is valid but malformed in minor ways (e.g., extra params preserved)
 # On failure: success=False, structured StageFailure with suggested_fixes
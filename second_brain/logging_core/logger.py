@@ -18,20 +18,108 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import sys
-from datetime import datetime
-from typing import Any, Dict
+import time
+from typing import Any, Dict, List, MutableMapping, Tuple
 from uuid import UUID
 
 from logging import Logger
 
+# orjson serializes in native code and returns UTF-8 bytes directly. It is a
+# declared dependency; the stdlib fallback only keeps logging alive if the
+# environment is incomplete — logs must never be the thing that crashes.
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# For individual values spliced into a pre-encoded line (no trailing newline)
+_ORJSON_VALUE_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS if orjson else 0
+
+# Encoded ',"run_id":...,"stage_name":...,"event_type":...' fragments. Within a
+# run these repeat on almost every record; cleared when full so finished runs
+# are not retained.
+_CONTEXT_FRAGMENT_LIMIT = 1024
+_context_fragments: Dict[Tuple[Any, Any, Any], bytes] = {}
+
+# (whole second, formatted timestamp) of the last record. Records arrive in
+# bursts within the same second, so most reuse the string. Replaced as one
+# tuple, so concurrent formatters never see a mismatched pair.
+_timestamp_cache: Tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(created: float) -> str:
+    """ISO-8601 UTC timestamp (second precision) for a record's creation time."""
+    global _timestamp_cache  # pylint: disable=global-statement
+    second = int(created)
+    cached_second, cached_text = _timestamp_cache
+    if cached_second != second:
+        cached_text = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+        _timestamp_cache = (second, cached_text)
+    return cached_text
+
 
 class JSONFormatter(logging.Formatter):
     """Custom formatter that outputs structured JSON lines."""
 
     def format(self, record: logging.LogRecord) -> str:
+        return self.format_bytes(record).decode("utf-8").rstrip("\n")
+
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Serialize the record as one UTF-8 JSON line, newline included."""
+        if orjson is not None:
+            return self._splice_log_line(record)
+
+        # default=str keeps unexpected metadata types (UUID, datetime, ...) loggable
+        log_record = self._build_log_record(record)
+        # Compact separators match orjson's output, so lines look the same either way
+        return (json.dumps(log_record, ensure_ascii=False, default=str, separators=(",", ":")) + "\n").encode("utf-8")
+
+    def _splice_log_line(self, record: logging.LogRecord) -> bytes:
+        """
+        orjson path: byte-identical to dumping _build_log_record's dict.
+
+        Only the variable values (message, metadata, exc_info) are encoded per
+        record; the run/stage/event fragment is encoded once and reused.
+        """
+        run_id = getattr(record, "run_id", None)
+        context = (
+            None if run_id is None else str(run_id),
+            getattr(record, "stage_name", None),
+            getattr(record, "event_type", None),
+        )
+        context_fragment = _context_fragments.get(context)
+        if context_fragment is None:
+            context_fragment = b"".join(
+                b',"' + name + b'":' + orjson.dumps(value, default=str, option=_ORJSON_VALUE_OPTIONS)
+                for name, value in zip((b"run_id", b"stage_name", b"event_type"), context)
+                if value is not None
+            )
+            if len(_context_fragments) >= _CONTEXT_FRAGMENT_LIMIT:
+                _context_fragments.clear()
+            _context_fragments[context] = context_fragment
+
+        parts = [
+            b'{"timestamp":"',
+            _format_timestamp(record.created).encode("ascii"),
+            b'","level":',
+            orjson.dumps(record.levelname),
+            b',"message":',
+            orjson.dumps(record.getMessage(), option=_ORJSON_VALUE_OPTIONS),
+            context_fragment,
+        ]
+        metadata = getattr(record, "metadata", None)
+        if metadata is not None:
+            parts += (b',"metadata":', orjson.dumps(metadata, default=str, option=_ORJSON_VALUE_OPTIONS))
+        if record.exc_info:
+            parts += (b',"exc_info":', orjson.dumps(self.formatException(record.exc_info)))
+        parts.append(b"}\n")
+        return b"".join(parts)
+
+    def _build_log_record(self, record: logging.LogRecord) -> Dict[str, Any]:
         log_record: Dict[str, Any] = {
-            "timestamp": datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
+            "timestamp": _format_timestamp(record.created),
             "level": record.levelname,
             "message": record.getMessage(),
         }
@@ -51,50 +139,161 @@ class JSONFormatter(logging.Formatter):
         if record.exc_info:
             log_record["exc_info"] = self.formatException(record.exc_info)
 
-        return json.dumps(log_record, ensure_ascii=False)
+        return log_record
 
 
-# Module-level cache to ensure single handler per run_id
-_loggers: Dict[str, Logger] = {}
-
+class BatchingStreamHandler(logging.StreamHandler):
+    """
+    StreamHandler that batches formatted records into a single write.
+
+    The stdlib StreamHandler writes and flushes on every record. This handler
+    keeps records in memory and writes them in one call when:
+    - flush() is called (the runner flushes at pipeline milestones)
+    - pending output exceeds buffer_size bytes
+    - a record at flush_level or above arrives (errors are never held back)
+    - the interpreter shuts down (logging.shutdown flushes every handler)
+
+    Records are serialized before the handler lock is taken, so concurrent
+    threads only contend for the list append, not for JSON encoding. Lines are
+    kept as UTF-8 bytes and written with os.write on the stream's file
+    descriptor when it has one (one syscall per batch, no Python I/O layers),
+    so JSONFormatter output is never decoded and re-encoded.
+    """
 
-def get_logger(run_id: UUID) -> Logger:
+    def __init__(self, stream: Any = None, buffer_size: int = 65536, flush_level: int = logging.ERROR) -> None:
+        super().__init__(stream)
+        self.buffer_size = buffer_size
+        self.flush_level = flush_level
+        self._pending: List[bytes] = []
+        self._pending_size = 0
+
+    def handle(self, record: logging.LogRecord) -> Any:
+        # Same contract as Handler.handle, but encoding happens outside the lock
+        filtered = self.filter(record)
+        if isinstance(filtered, logging.LogRecord):  # Python 3.12+ filters may return a record
+            record = filtered
+        if filtered:
+            line = self._encode(record)
+            if line is not None:
+                self.acquire()
+                try:
+                    self._enqueue(line, record.levelno)
+                finally:
+                    self.release()
+        return filtered
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Called with the handler lock held (direct callers of emit only)
+        line = self._encode(record)
+        if line is not None:
+            self._enqueue(line, record.levelno)
+
+    def _encode(self, record: logging.LogRecord) -> bytes | None:
+        try:
+            formatter = self.formatter
+            if isinstance(formatter, JSONFormatter):
+                return formatter.format_bytes(record)
+            return (self.format(record) + self.terminator).encode("utf-8")
+        except Exception:  # pylint: disable=broad-except
+            self.handleError(record)
+            return None
+
+    def _enqueue(self, line: bytes, levelno: int) -> None:
+        self._pending.append(line)
+        self._pending_size += len(line)
+
+        if levelno >= self.flush_level:
+            self._write_pending(flush_stream=True)
+        elif self._pending_size >= self.buffer_size:
+            self._write_pending(flush_stream=False)
+
+    def flush(self) -> None:
+        self.acquire()
+        try:
+            self._write_pending(flush_stream=True)
+        finally:
+            self.release()
+
+    def _write_pending(self, flush_stream: bool) -> None:
+        if self._pending:
+            payload = b"".join(self._pending)
+            binary_stream = getattr(self.stream, "buffer", None)
+            fd = self._fileno()
+            if fd is not None:
+                # Drain any text already buffered on the stream to keep ordering
+                self.stream.flush()
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]  # os.write may write partially
+            elif binary_stream is not None:
+                # Drain any text already buffered on the stream to keep ordering
+                self.stream.flush()
+                binary_stream.write(payload)
+                if flush_stream:
+                    binary_stream.flush()
+            else:
+                self.stream.write(payload.decode("utf-8"))
+            self._pending.clear()
+            self._pending_size = 0
+        if flush_stream and hasattr(self.stream, "flush"):
+            self.stream.flush()
+
+    def _fileno(self) -> int | None:
+        try:
+            return self.stream.fileno()
+        except (AttributeError, OSError, ValueError):  # io.UnsupportedOperation is an OSError
+            return None
+
+
+class RunLogger(logging.LoggerAdapter):
     """
-    Return a configured logger for the given workflow run.
+    Per-run view of the shared ingestor logger that stamps run_id on every record.
 
-    Logs are emitted as JSON lines to stdout.
-    One logger instance per run_id (idempotent).
+    Merges the caller's extra with the run's instead of replacing it (the
+    stdlib adapter drops call-site extra before Python 3.13).
     """
-    run_id_str = str(run_id)
 
-    if run_id_str in _loggers:
-        return _loggers[run_id_str]
+    def process(self, msg: Any, kwargs: MutableMapping[str, Any]) -> Tuple[Any, MutableMapping[str, Any]]:
+        extra = kwargs.get("extra")
+        kwargs["extra"] = {**self.extra, **extra} if extra else self.extra
+        return msg, kwargs
+
 
-    logger = logging.getLogger(f"second_brain.ingestor.{run_id_str}")
-    logger.setLevel(logging.INFO)
-    logger.propagate = False
+def _configure_base_logger() -> Logger:
+    base_logger = logging.getLogger("second_brain.ingestor")
+    base_logger.setLevel(logging.INFO)
+    base_logger.propagate = False
 
-    # Avoid duplicate handlers
-    if not logger.handlers:
-        handler = logging.StreamHandler(sys.stdout)
+    # Avoid duplicate handlers if the module is reloaded
+    if not base_logger.handlers:
+        handler = BatchingStreamHandler(sys.stdout)
         handler.setFormatter(JSONFormatter())
-        logger.addHandler(handler)
+        base_logger.addHandler(handler)
+    return base_logger
 
-    _loggers[run_id_str] = logger
 
-    # Bind run_id to all records via filter
-    class RunIdFilter(logging.Filter):
-        def filter(self, record: logging.LogRecord) -> bool:
-            record.run_id = run_id_str  # type: ignore
-            return True
+# One logger and handler for all runs; runs differ only in their adapter
+_base_logger = _configure_base_logger()
 
-    logger.addFilter(RunIdFilter())
 
-    return logger
+def get_logger(run_id: UUID | str) -> RunLogger:
+    """
+    Return a logger bound to the given workflow run.
+
+    Logs are emitted as JSON lines to stdout, batched until flush_logs()
+    (or an ERROR-level record) writes them out.
+    The adapter is a lightweight view over one shared logger, so nothing is
+    retained per run once the caller drops it.
+    Accepts the UUID or its hex string, so callers that already hold the
+    string form skip re-formatting.
+    """
+    # Hex form matches Identity.workflow_run_id in the artifact
+    run_id_str = run_id if isinstance(run_id, str) else run_id.hex
+    return RunLogger(_base_logger, {"run_id": run_id_str})
 
 
 def log_event(
-    logger: Logger,
+    logger: Logger | RunLogger,
     level: int,
     message: str,
     *,
@@ -116,6 +315,19 @@ def log_event(
     logger.log(level, message, extra=extra)
 
 
+def flush_logs(logger: Logger | RunLogger) -> None:
+    """
+    Write out any batched log records for this logger.
+
+    Call at pipeline milestones (start, stage boundaries, end) so logs stay
+    close to real time while records in between share one write.
+    The handler is shared, so this also writes out other runs' pending records.
+    """
+    base_logger = logger.logger if isinstance(logger, logging.LoggerAdapter) else logger
+    for handler in base_logger.handlers:
+        handler.flush()
+
+
 # High-Level Intent
 # logging/logger.py is the centralized, structured logging facility for the entire Content Ingestor pipeline.
 # Its single responsibility: provide a pre-configured logger that emits JSON-line structured logs with mandatory fields (run_id, stage_name, event_type, timestamp, message, metadata).
@@ -129,7 +341,7 @@ def log_event(
 # No log strings are free-form — everything is dict-based.
 # Architecture
 
-# Singleton-like get_logger(run_id: UUID) -> Logger function.
+# get_logger(run_id: UUID) -> RunLogger: adapter over one shared logger/handler, run_id carried in extra.
 # Uses Python logging with custom JSONFormatter.
 # All logs include required fields via extra.
 # Levels used intentionally (INFO for progress, WARNING for degradation, ERROR for stage failure).
@@ -150,4 +362,5 @@ def log_event(
 # Extension Points
 
 # Swap handler for file output, syslog, or remote (e.g., Loki) via config.
+# Tune BatchingStreamHandler.buffer_size for high-volume batch runs.
 # Add correlation IDs for distributed runs later.
\ No newline at end of file
@@ -0,0 +1,24 @@
+# second_brain/transcription/_url.py
+"""
+Shared YouTube URL helper for the transcription strategies.
+Single responsibility: map a video URL to its video_id (cached per URL).
+"""
+
+from __future__ import annotations
+
+import functools
+
+
+@functools.lru_cache(maxsize=1024)
+def extract_video_id(url: str) -> str:
+    """
+    Return the video_id of a watch (?v=) or youtu.be URL.
+
+    Cached so the caption attempt and the audio fallback for the same URL
+    parse it once. Raises ValueError for other URLs (errors are not cached).
+    """
+    if "v=" in url:
+        return url.split("v=")[1].split("&")[0]
+    if "youtu.be/" in url:
+        return url.split("youtu.be/")[1].split("?")[0].split("#")[0]
+    raise ValueError("Invalid YouTube URL")
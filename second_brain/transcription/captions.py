@@ -2,20 +2,40 @@
 """
 Caption strategy using youtube_transcript_api.
 Single responsibility: fetch and concatenate captions.
+Concatenated captions are cached locally per video_id (captions rarely change).
 """
 
 from __future__ import annotations
 
 from typing import List
 from second_brain.transcription.schema import TranscriptionResult
+from second_brain.transcription._url import extract_video_id
+from second_brain.cache_core.sqlite_store import get_cache
+
+CACHE_NAMESPACE = "yt_captions"
+CAPTIONS_TTL_SECONDS = 7 * 86400
+
+
 def get_captions(youtube_url: str) -> TranscriptionResult:
     try:
         from youtube_transcript_api import YouTubeTranscriptApi
         from youtube_transcript_api._errors import TranscriptsDisabled, NoTranscriptFound
 
-        video_id = _extract_video_id(youtube_url)
+        video_id = extract_video_id(youtube_url)
+        cached = get_cache().get(CACHE_NAMESPACE, video_id, max_age_seconds=CAPTIONS_TTL_SECONDS)
+        if cached is not None:
+            return TranscriptionResult(
+                success=True,
+                transcript_text=cached.value,
+                method="captions",
+            )
+
         transcript = YouTubeTranscriptApi.get_transcript(video_id)
-        text = " ".join(segment["text"] for segment in transcript)
+        # A list lets join size the result in one pass (a generator is materialized anyway)
+        parts = [segment_text for segment in transcript if (segment_text := segment["text"].strip())]
+        text = " ".join(parts)
+        if text:
+            get_cache().set(CACHE_NAMESPACE, video_id, text)
 
         return TranscriptionResult(
             success=True,
@@ -33,10 +53,4 @@ def get_captions(youtube_url: str) -> TranscriptionResult:
             success=False,
             errors=[str(e)],
             suggested_fixes=["Retry caption fetch"],
-        )
-
-
-def _extract_video_id(url: str) -> str:
-    if "v=" in url:
-        return url.split("v=")[1].split("&")[0]
-    raise ValueError("Invalid YouTube URL")
\ No newline at end of file
+        )
\ No newline at end of file
@@ -6,19 +6,24 @@ Single responsibility: sequence strategies, map to result contract.
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Sequence
 import time
 
 from second_brain.transcription.captions import get_captions
-from second_brain.transcription.whisper import transcribe_audio
+from second_brain.transcription.whisper import transcribe_audio, transcribe_audio_batch
 from second_brain.transcription.schema import TranscriptionConfig, TranscriptionResult
 
+# Concurrent caption fetches / audio downloads in transcribe_batch
+DEFAULT_BATCH_WORKERS = 4
+
 @dataclass
 class TranscriptionConfig:
     """Config for transcription modes."""
     download_audio_dir: Optional[str] = None  # None: temp, str: save path
     transcribe: bool = True  # False: download only
+    captions_available: Optional[bool] = None  # False: skip the captions attempt; None: unknown
 
 
 @dataclass
@@ -37,8 +42,8 @@ def transcribe(youtube_url: str, config: TranscriptionConfig = TranscriptionConf
     """Orchestrate transcription with fallback."""
     start = time.time()
 
-    # Try captions (fast path)
-    captions_result = get_captions(youtube_url)
+    # Try captions (fast path), unless metadata already showed there are none
+    captions_result = _try_captions(youtube_url, config)
     if captions_result.success:
         captions_result.execution_time_sec = time.time() - start
         return captions_result
@@ -46,10 +51,55 @@ def transcribe(youtube_url: str, config: TranscriptionConfig = TranscriptionConf
     # Fallback to whisper (audio required)
     whisper_result = transcribe_audio(youtube_url, config.download_audio_dir, config.transcribe)
     whisper_result.execution_time_sec = time.time() - start
+    return _merge_attempts(whisper_result, captions_result)
+
+
+def transcribe_batch(
+    youtube_urls: Sequence[str],
+    config: TranscriptionConfig = TranscriptionConfig(),
+    max_workers: int = DEFAULT_BATCH_WORKERS,
+) -> List[TranscriptionResult]:
+    """
+    Transcribe many videos: captions fetched concurrently, then one batched audio fallback.
+
+    Videos without captions are downloaded concurrently and transcribed through
+    a single batched whisper pipeline. Results are returned in input order;
+    execution_time_sec is the time from the start of the batch until each
+    result was final.
+    Not re-exported from second_brain.transcription: there is no multi-video
+    entry point yet, so callers import it from this module explicitly.
+    """
+    start = time.time()
+    if not youtube_urls:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(youtube_urls))), thread_name_prefix="captions") as pool:
+        results = list(pool.map(lambda url: _try_captions(url, config), youtube_urls))
+    for result in results:
+        result.execution_time_sec = time.time() - start
 
+    fallback_indexes = [index for index, result in enumerate(results) if not result.success]
+    whisper_results = transcribe_audio_batch(
+        [youtube_urls[index] for index in fallback_indexes],
+        config.download_audio_dir,
+        config.transcribe,
+        max_downloads=max_workers,
+    )
+    for index, whisper_result in zip(fallback_indexes, whisper_results):
+        whisper_result.execution_time_sec = time.time() - start
+        results[index] = _merge_attempts(whisper_result, results[index])
+    return results
+
+
+def _try_captions(youtube_url: str, config: TranscriptionConfig) -> TranscriptionResult:
+    if config.captions_available is False:
+        return TranscriptionResult(success=False, warnings=["YouTube captions unavailable"])
+    return get_captions(youtube_url)
+
+
+def _merge_attempts(whisper_result: TranscriptionResult, captions_result: TranscriptionResult) -> TranscriptionResult:
     # Merge warnings/errors from captions attempt
     whisper_result.warnings.extend(captions_result.warnings)
     whisper_result.errors.extend(captions_result.errors)
     whisper_result.suggested_fixes.extend(captions_result.suggested_fixes)
-
-    return whisper_result
\ No newline at end of file
+    return whisper_result
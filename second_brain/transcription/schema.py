@@ -15,6 +15,7 @@ class TranscriptionConfig:
     """Configuration for transcription modes."""
     download_audio_dir: Optional[str] = None  # Save path or None for temp
     transcribe: bool = True  # False: audio only
+    captions_available: Optional[bool] = None  # False: skip the captions attempt; None: unknown
 
 
 @dataclass
@@ -3,89 +3,188 @@
 Whisper strategy: audio extraction + transcription.
 Single responsibility: manage audio lifecycle and model invocation.
 Model cached module-level; GPU detection.
+Inference runs on faster-whisper (CTranslate2) with int8-quantized weights.
 """
 
 from __future__ import annotations
 
 import os
-import subprocess
 import tempfile
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
-import torch
-import whisper
+import ctranslate2
+import yt_dlp
+from faster_whisper import WhisperModel
 
-from second_brain.transcription.schema import TranscriptionResult
-
-# Module-level cache
-_MODEL: Optional[whisper.Whisper] = None
-_DEVICE = "cuda" if torch.cuda.is_available() else "cpu"
+if TYPE_CHECKING:
+    from faster_whisper import BatchedInferencePipeline
 
-
-def _load_model(model_name: str = "base") -> whisper.Whisper:
-    global _MODEL  # pylint: disable=global-statement
-    if _MODEL is None:
-        _MODEL = whisper.load_model(model_name, device=_DEVICE)
-    return _MODEL
+from second_brain.transcription.schema import TranscriptionResult
+from second_brain.transcription._url import extract_video_id
+
+# Module-level cache: one model per (model_name, device), shared by all runs in the process
+_MODELS: Dict[Tuple[str, str], WhisperModel] = {}
+_MODEL_LOCK = threading.Lock()
+_DEVICE = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+# int8 weights: several times faster than fp32 whisper at equivalent WER
+_COMPUTE_TYPE = "int8" if _DEVICE == "cpu" else "int8_float16"
+
+# transcribe_audio_batch: concurrent audio downloads, and chunks decoded per forward pass
+DEFAULT_MAX_DOWNLOADS = 4
+DEFAULT_BATCH_SIZE = 16
+
+# Best audio stream, converted to WAV by ffmpeg (same as the former yt-dlp CLI flags)
+_DOWNLOAD_PARAMS: Dict[str, Any] = {
+    "format": "bestaudio",
+    "postprocessors": [{"key": "FFmpegExtractAudio", "preferredcodec": "wav"}],
+    "noplaylist": True,
+    "quiet": True,
+    "no_warnings": True,
+}
+
+
+def _load_model(model_name: str = "base") -> WhisperModel:
+    key = (model_name, _DEVICE)
+    model = _MODELS.get(key)
+    if model is None:
+        with _MODEL_LOCK:  # a warm-up and a transcription must not both load it
+            model = _MODELS.get(key)
+            if model is None:
+                model = _MODELS[key] = WhisperModel(model_name, device=_DEVICE, compute_type=_COMPUTE_TYPE)
+    return model
+
+
+def warm_model() -> None:
+    """Load the model ahead of need; failures are left for transcribe_audio to report."""
+    try:
+        _load_model()
+    except Exception:  # pylint: disable=broad-except
+        pass
 
 
 def transcribe_audio(youtube_url: str, save_dir: Optional[str], do_transcribe: bool) -> TranscriptionResult:
     try:
-        if save_dir:
-            audio_path = os.path.join(save_dir, f"{_extract_video_id(youtube_url)}.wav")
-            os.makedirs(save_dir, exist_ok=True)
-        else:
-            tmpdir = tempfile.TemporaryDirectory()
-            audio_path = os.path.join(tmpdir.name, "audio.wav")
+        audio_path, tmpdir = _fetch_audio(youtube_url, save_dir)
+        try:
+            text = _transcribe_file(_load_model(), audio_path) if do_transcribe else None
+        finally:
+            if tmpdir is not None:
+                tmpdir.cleanup()  # Delete temp audio
+        return _audio_result(audio_path, save_dir, text)
 
+    except Exception as e:
+        return _audio_failure(e)
+
+
+def transcribe_audio_batch(
+    youtube_urls: Sequence[str],
+    save_dir: Optional[str],
+    do_transcribe: bool,
+    max_downloads: int = DEFAULT_MAX_DOWNLOADS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> List[TranscriptionResult]:
+    """
+    Audio fallback for many videos: concurrent downloads, then batched inference.
+
+    Downloads are network-bound and overlap on a thread pool. Transcription
+    goes through faster-whisper's BatchedInferencePipeline, which decodes
+    batch_size chunks of a file per forward pass instead of one window at a
+    time, keeping the GPU busy. Results are returned in input order.
+    """
+    if not youtube_urls:
+        return []
+
+    def download(youtube_url: str) -> Tuple[Optional[Tuple[str, Optional[tempfile.TemporaryDirectory]]], Optional[Exception]]:
+        try:
+            return _fetch_audio(youtube_url, save_dir), None
+        except Exception as e:  # pylint: disable=broad-except
+            return None, e
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_downloads, len(youtube_urls))), thread_name_prefix="audio-download") as pool:
+        downloads = list(pool.map(download, youtube_urls))
+
+    pipeline: Optional["BatchedInferencePipeline"] = None
+    results: List[TranscriptionResult] = []
+    for downloaded, error in downloads:
+        if downloaded is None:
+            results.append(_audio_failure(error))
+            continue
+        audio_path, tmpdir = downloaded
+        try:
+            text = None
+            if do_transcribe:
+                if pipeline is None:
+                    # faster-whisper >= 1.1; imported here so the single-file path never needs it
+                    from faster_whisper import BatchedInferencePipeline
+
+                    pipeline = BatchedInferencePipeline(model=_load_model())
+                text = _transcribe_file(pipeline, audio_path, batch_size=batch_size)
+            results.append(_audio_result(audio_path, save_dir, text))
+        except Exception as e:  # pylint: disable=broad-except
+            results.append(_audio_failure(e))
+        finally:
+            if tmpdir is not None:
+                tmpdir.cleanup()
+    return results
+
+
+def _fetch_audio(youtube_url: str, save_dir: Optional[str]) -> Tuple[str, Optional[tempfile.TemporaryDirectory]]:
+    """Download the audio as WAV; returns its path and the temp dir to clean up (None when saved)."""
+    if save_dir:
+        audio_path = os.path.join(save_dir, f"{extract_video_id(youtube_url)}.wav")
+        os.makedirs(save_dir, exist_ok=True)
         _download_audio(youtube_url, audio_path)
+        return audio_path, None
 
-        result = TranscriptionResult(
-            success=True,
-            audio_path=audio_path if save_dir else None,
-            method="whisper",
-            warnings=["Used audio fallback (slower)"],
-        )
-
-        if do_transcribe:
-            model = _load_model()
-            whisper_result = model.transcribe(audio_path)
-            text = whisper_result.get("text", "").strip()
-
-            if not text:
-                result.success = False
-                result.errors = ["Whisper returned empty transcript"]
-                result.suggested_fixes = ["Check audio quality", "Try larger model"]
-            else:
-                result.transcript_text = text
-
-        if not save_dir:
-            tmpdir.cleanup()  # Delete temp audio
-
-        return result
-
-    except Exception as e:
-        return TranscriptionResult(
-            success=False,
-            errors=[str(e)],
-            suggested_fixes=["Ensure yt-dlp/whisper installed", "Check ffmpeg"],
-        )
+    tmpdir = tempfile.TemporaryDirectory()
+    audio_path = os.path.join(tmpdir.name, "audio.wav")
+    try:
+        _download_audio(youtube_url, audio_path)
+    except Exception:
+        tmpdir.cleanup()
+        raise
+    return audio_path, tmpdir
+
+
+def _transcribe_file(transcriber: Any, audio_path: str, **options: Any) -> str:
+    """Run a WhisperModel or BatchedInferencePipeline over one file and join its segments."""
+    # Segments are decoded lazily while iterating; greedy decoding (beam_size=1)
+    segments, _ = transcriber.transcribe(audio_path, beam_size=1, **options)
+    return "".join(segment.text for segment in segments).strip()
+
+
+def _audio_result(audio_path: str, save_dir: Optional[str], text: Optional[str]) -> TranscriptionResult:
+    """Result for a downloaded file; text is None when transcription was not requested."""
+    result = TranscriptionResult(
+        success=True,
+        audio_path=audio_path if save_dir else None,
+        method="whisper",
+        warnings=["Used audio fallback (slower)"],
+    )
+    if text is not None:
+        if not text:
+            result.success = False
+            result.errors = ["Whisper returned empty transcript"]
+            result.suggested_fixes = ["Check audio quality", "Try larger model"]
+        else:
+            result.transcript_text = text
+    return result
 
 
-def _extract_video_id(url: str) -> str:
-    if "v=" in url:
-        return url.split("v=")[1].split("&")[0]
-    raise ValueError("Invalid YouTube URL")
+def _audio_failure(error: Exception) -> TranscriptionResult:
+    return TranscriptionResult(
+        success=False,
+        errors=[str(error)],
+        suggested_fixes=["Ensure yt-dlp/whisper installed", "Check ffmpeg"],
+    )
 
 
 def _download_audio(youtube_url: str, output_path: str) -> None:
-    output_template = output_path.replace(".wav", ".%(ext)s")
-    command = [
-        "yt-dlp",
-        "-f", "bestaudio",
-        "--extract-audio",
-        "--audio-format", "wav",
-        "-o", output_template,
-        youtube_url,
-    ]
-    subprocess.run(command, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
\ No newline at end of file
+    # In-process download: no interpreter start-up or yt-dlp import per video.
+    # A fresh instance per call because the output template differs per video
+    # and YoutubeDL is not safe to share between concurrent runs.
+    params = dict(_DOWNLOAD_PARAMS, outtmpl=output_path.replace(".wav", ".%(ext)s"))
+    with yt_dlp.YoutubeDL(params) as ydl:
+        ydl.download([youtube_url])
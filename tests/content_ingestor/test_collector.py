@@ -0,0 +1,71 @@
+# tests/content_ingestor/test_collector.py
+"""DiagnosticsCollector: global messages are deduplicated in first-seen order."""
+
+from __future__ import annotations
+
+import uuid
+
+import pytest
+
+from second_brain.content_ingestor.diagnostics.collector import DiagnosticsCollector
+from second_brain.content_ingestor.schema import FailureType, StageFailure, StageResult
+
+
+def _collector_with_two_stages() -> DiagnosticsCollector:
+    collector = DiagnosticsCollector(uuid.uuid4())
+    collector.add_stage_result(
+        StageResult(
+            stage_name="fetch_metadata",
+            success=True,
+            warnings=["Metadata fetch slow", "Review logs"],
+            suggested_fixes=["Retry later"],
+        )
+    )
+    collector.add_stage_result(
+        StageResult(
+            stage_name="analyze_structure",
+            success=False,
+            warnings=["Review logs", "Transcript truncated"],
+            errors=["AI returned invalid JSON"],
+            failures=[
+                StageFailure(
+                    stage="analyze_structure",
+                    type=FailureType.STRUCTURE_ERROR,
+                    cause="invalid_json_response",
+                    impact="Structural fields empty",
+                    suggested_fixes=["Review prompt", "Retry later"],
+                )
+            ],
+        )
+    )
+    return collector
+
+
+def test_messages_deduplicated_in_first_seen_order():
+    diagnostics = _collector_with_two_stages().build_diagnostics_model()
+
+    assert diagnostics.warnings == ["Metadata fetch slow", "Review logs", "Transcript truncated"]
+    assert diagnostics.errors == ["AI returned invalid JSON"]
+    # Failure-level fixes are merged after the stage's own, without repeats
+    assert diagnostics.suggested_fixes == ["Retry later", "Review prompt"]
+    assert list(diagnostics.stage_status) == ["fetch_metadata", "analyze_structure"]
+
+
+def test_fatal_failure_reported():
+    assert _collector_with_two_stages().has_fatal_failure()
+
+
+def test_duplicate_stage_rejected():
+    collector = DiagnosticsCollector(uuid.uuid4())
+    collector.add_stage_result(StageResult(stage_name="validate_input", success=True))
+
+    with pytest.raises(ValueError):
+        collector.add_stage_result(StageResult(stage_name="validate_input", success=True))
+
+
+def test_single_use_after_build():
+    collector = _collector_with_two_stages()
+    collector.build_diagnostics_model()
+
+    with pytest.raises(RuntimeError):
+        collector.add_stage_result(StageResult(stage_name="analyze_semantics", success=True))
@@ -0,0 +1,103 @@
+# tests/content_ingestor/test_fetch_metadata.py
+"""fetch_metadata batch APIs against a stubbed YoutubeDL (no network)."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import uuid
+
+import pytest
+
+from second_brain.content_ingestor.stages import fetch_metadata
+
+
+class _FakeYoutubeDL:
+    """Records construction/close; returns canned info, partial for ids starting with "partial"."""
+
+    instances = []
+    lock = threading.Lock()
+
+    def __init__(self, params):
+        self.fast = "youtube" in params["extractor_args"]
+        self.closed = False
+        self.urls = []
+        with self.lock:
+            self.instances.append(self)
+
+    def extract_info(self, url, download=False):
+        assert not download
+        assert not self.closed
+        self.urls.append(url)
+        video_id = url.rsplit("=", 1)[1]
+        if video_id == "missing":
+            raise fetch_metadata.yt_dlp.DownloadError("Video unavailable")
+        info = {
+            "title": f"Title {video_id}",
+            "channel": "Channel",
+            "duration": 60,
+            "timestamp": 1700000000,
+            "automatic_captions": {"en": []},
+            "chapters": [{"start_time": 0.0, "end_time": 30.0, "title": "Intro"}],
+        }
+        if self.fast and video_id.startswith("partial"):
+            info["duration"] = None
+        return info
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def fake_ydl(monkeypatch):
+    _FakeYoutubeDL.instances = []
+    monkeypatch.setattr(fetch_metadata.yt_dlp, "YoutubeDL", _FakeYoutubeDL)
+    # Fresh pools so instances from other tests are never handed out
+    monkeypatch.setattr(fetch_metadata, "_ydl_pool", fetch_metadata._YDLPool(fetch_metadata.YDL_PARAMS))
+    monkeypatch.setattr(fetch_metadata, "_fallback_ydl_pool", fetch_metadata._YDLPool(fetch_metadata.FALLBACK_YDL_PARAMS))
+    return _FakeYoutubeDL
+
+
+_CONFIG = {"metadata_cache": False, "transcribe": False}
+
+
+def _content_object(video_id):
+    return {"source": {"video_id": video_id}, "raw": {}, "diagnostics": {}}
+
+
+def test_process_batch_shares_one_instance_and_keeps_order(fake_ydl):
+    objects = [_content_object(video_id) for video_id in ("a", "partial1", "b", "missing")]
+
+    outcomes = fetch_metadata.process_batch(objects, uuid.uuid4(), _CONFIG)
+
+    assert [content_object["source"]["video_id"] for content_object, _ in outcomes] == ["a", "partial1", "b", "missing"]
+    assert [result.success for _, result in outcomes] == [True, True, True, False]
+    assert outcomes[1][0]["source"]["duration_seconds"] == 60  # filled by the fallback clients
+    assert outcomes[0][0]["raw"]["chapters"] == [{"title": "Intro", "start_time": 0.0}]
+
+    fast = [ydl for ydl in fake_ydl.instances if ydl.fast]
+    fallback = [ydl for ydl in fake_ydl.instances if not ydl.fast]
+    assert len(fast) == 1 and len(fast[0].urls) == 4
+    # Only the partial and the failed video re-extract, through one instance
+    assert len(fallback) == 1 and len(fallback[0].urls) == 2
+
+
+def test_process_many_keeps_order_and_pools_instances(fake_ydl):
+    video_ids = [f"v{index}" for index in range(12)]
+    config = {**_CONFIG, "metadata_concurrency": 4}
+
+    outcomes = asyncio.run(fetch_metadata.process_many([_content_object(v) for v in video_ids], uuid.uuid4(), config))
+    asyncio.run(fetch_metadata.process_many([_content_object(v) for v in video_ids], uuid.uuid4(), config))
+
+    assert [content_object["source"]["title"] for content_object, _ in outcomes] == [f"Title {v}" for v in video_ids]
+    assert all(result.success for _, result in outcomes)
+    # At most one instance per concurrent extraction, reused by the second run
+    assert 1 <= len(fake_ydl.instances) <= 4
+    assert not any(ydl.closed for ydl in fake_ydl.instances)
+
+    fetch_metadata._close_ydls()
+    assert all(ydl.closed for ydl in fake_ydl.instances)
+
+
+def test_process_many_empty():
+    assert asyncio.run(fetch_metadata.process_many([], uuid.uuid4(), _CONFIG)) == []
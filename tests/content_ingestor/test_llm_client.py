@@ -0,0 +1,113 @@
+# tests/content_ingestor/test_llm_client.py
+"""Shared LLM plumbing: stream cut-off, retry classification, response parsing."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from pydantic import ValidationError
+
+from second_brain.content_ingestor.stages._llm_client import (
+    TransientLLMError,
+    _is_transient,
+    _JSONObjectEnd,
+    parse_response,
+)
+from second_brain.content_ingestor.stages.analyze_structure import StructuredResponse
+
+
+def _object_in(chunks):
+    """Feed chunks like a stream; return the text of the first complete object (or None)."""
+    scanner = _JSONObjectEnd()
+    text = ""
+    for chunk in chunks:
+        end = scanner.feed(chunk, len(text))
+        text += chunk
+        if end is not None:
+            return text[scanner.start:end]
+    return None
+
+
+def test_scanner_ignores_braces_inside_strings():
+    assert _object_in(['{"title": "a } b { c"}', " trailing"]) == '{"title": "a } b { c"}'
+
+
+def test_scanner_handles_escaped_quotes_and_backslashes():
+    payload = '{"a": "say \\"}\\" ok", "b": "C:\\\\"}'
+    assert _object_in([payload + "}}"]) == payload
+    assert json.loads(_object_in([payload])) == {"a": 'say "}" ok', "b": "C:\\"}
+
+
+def test_scanner_skips_leading_chatter_and_spans_chunks():
+    chunks = ['Sure! Here is "the" JSON:\n{"sec', 'tions": [{"title": "x"}], ', '"entities": []}', "\nDone."]
+    assert _object_in(chunks) == '{"sections": [{"title": "x"}], "entities": []}'
+
+
+def test_scanner_incomplete_object():
+    assert _object_in(['{"sections": [', '{"title": "x"}']) is None
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class _Response:
+    status_code = 503
+
+
+class _ResponseError(Exception):
+    response = _Response()
+
+
+class RateLimitError(Exception):
+    """Named like the provider SDK's class; matched by name."""
+
+
+class _ProviderRateLimit(RateLimitError):
+    pass
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        TimeoutError("read timed out"),
+        ConnectionResetError("reset by peer"),
+        _StatusError(429),
+        _StatusError(500),
+        _ResponseError("service unavailable"),
+        _ProviderRateLimit("slow down"),
+    ],
+)
+def test_transient_errors(exc):
+    assert _is_transient(exc)
+
+
+@pytest.mark.parametrize("exc", [ValueError("bad"), _StatusError(400), _StatusError(401), RuntimeError("quota")])
+def test_permanent_errors(exc):
+    assert not _is_transient(exc)
+
+
+def test_transient_error_is_runtime_error():
+    # Stages catch RuntimeError for llm_invocation_failed; retries must not change that
+    assert issubclass(TransientLLMError, RuntimeError)
+
+
+def test_parse_response_valid():
+    validated = parse_response('{"entities": ["pydantic"]}', StructuredResponse.__pydantic_validator__)
+    assert isinstance(validated, StructuredResponse)
+    assert validated.entities == ["pydantic"]
+
+
+@pytest.mark.parametrize("raw", ['{"entities": ["x"]', "not json", ""])
+def test_parse_response_invalid_json(raw):
+    with pytest.raises(json.JSONDecodeError) as excinfo:
+        parse_response(raw, StructuredResponse.__pydantic_validator__)
+    assert excinfo.value.doc == raw
+
+
+def test_parse_response_schema_violation():
+    with pytest.raises(ValidationError):
+        parse_response('{"entities": "not a list"}', StructuredResponse.__pydantic_validator__)
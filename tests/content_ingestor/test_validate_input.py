@@ -0,0 +1,50 @@
+# tests/content_ingestor/test_validate_input.py
+"""Video id extraction: the prefix fast path must agree with YOUTUBE_REGEX."""
+
+from __future__ import annotations
+
+import pytest
+
+from second_brain.content_ingestor.stages.validate_input import YOUTUBE_REGEX, _extract_video_id
+
+
+def _regex_video_id(url: str):
+    match = YOUTUBE_REGEX.search(url)
+    return match.group(1).split("&")[0] if match else None
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "http://www.youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ&list=PL123&index=2",
+        "https://www.youtube.com/watch?v=dQw4w9WgXcQ#t=42",
+        "https://youtu.be/dQw4w9WgXcQ",
+        "http://youtu.be/dQw4w9WgXcQ?t=42",
+        "https://youtu.be/dQw4w9WgXcQ\ntrailing",
+        # Raw text is returned as-is: no percent-decoding on either path
+        "https://www.youtube.com/watch?v=dQw4%2Fw9WgXcQ",
+        "https://youtu.be/dQw4w9WgXcQé",
+    ],
+)
+def test_fast_path_matches_regex(url):
+    assert _extract_video_id(url) == _regex_video_id(url)
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://www.youtube.com/embed/dQw4w9WgXcQ",
+        "https://www.youtube.com/shorts/dQw4w9WgXcQ",
+        "youtube.com/watch?v=dQw4w9WgXcQ",
+        "https://www.youtube.com/watch?v=",
+    ],
+)
+def test_other_shapes_fall_back_to_regex(url):
+    assert _extract_video_id(url) == _regex_video_id(url)
+
+
+def test_non_youtube_url_has_no_id():
+    assert _extract_video_id("https://example.com/watch?v=dQw4w9WgXcQ") is None
@@ -0,0 +1,47 @@
+# tests/content_ingestor/test_writer.py
+"""Artifact writer: the streamed transcript must round-trip through json.loads."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from second_brain.content_ingestor.output import writer
+from second_brain.content_ingestor.schema import ContentObject, Identity, Raw, Source
+
+
+# Quotes, backslashes, control characters and non-ASCII text, so chunk
+# boundaries land on characters that need escaping
+_TRANSCRIPT_PIECE = 'He said "print(\\n)" — naïve café 日本語 🎉\ttab\\path\n'
+
+
+def _content_object(transcript: str) -> ContentObject:
+    return ContentObject(
+        identity=Identity(),
+        source=Source(url="https://www.youtube.com/watch?v=dQw4w9WgXcQ", video_id="dQw4w9WgXcQ", title="Tïtle \"quoted\""),
+        raw=Raw(transcript_text=transcript, tags=["a", "b"]),
+    )
+
+
+@pytest.mark.parametrize("chunk_chars", [writer.TRANSCRIPT_CHUNK_CHARS, 7])
+def test_transcript_round_trips(tmp_path, monkeypatch, chunk_chars):
+    monkeypatch.setattr(writer, "TRANSCRIPT_CHUNK_CHARS", chunk_chars)
+    transcript = _TRANSCRIPT_PIECE * (writer.TRANSCRIPT_CHUNK_CHARS // len(_TRANSCRIPT_PIECE) + 10)
+    assert len(transcript) > chunk_chars
+    content_object = _content_object(transcript)
+
+    artifact_path = writer.write_artifact(content_object, tmp_path)
+    document = json.loads(artifact_path.read_text(encoding="utf-8"))
+
+    assert document["raw"]["transcript_text"] == transcript
+    assert document == json.loads(content_object.model_dump_json(exclude_none=True, warnings=False))
+
+
+def test_artifact_without_transcript(tmp_path):
+    content_object = _content_object("")
+
+    artifact_path = writer.write_artifact(content_object, tmp_path)
+
+    assert artifact_path.name == f"dQw4w9WgXcQ_{content_object.identity.content_id}.json"
+    assert json.loads(artifact_path.read_text(encoding="utf-8"))["source"]["video_id"] == "dQw4w9WgXcQ"